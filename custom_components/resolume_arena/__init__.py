@@ -1,27 +1,59 @@
 """Resolume Arena integration."""
 from homeassistant.const import CONF_HOST, CONF_PORT
-from .coordinator import ResolumeDataUpdateCoordinator
+import homeassistant.helpers.config_validation as cv
+from .coordinator import ResolumeDataUpdateCoordinator, async_remove_cache
 from .const import DOMAIN
+from .services import async_setup_services
+from .views import ResolumeThumbnailView
 
 PLATFORMS = ["button", "sensor", "binary_sensor"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass, config):
+    """Register services once, whatever the number of entries."""
+    async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass, entry):
     """Set up the integration from a config entry."""
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    coordinator = ResolumeDataUpdateCoordinator(hass, host, port)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = ResolumeDataUpdateCoordinator(hass, host, port, entry.options)
+    if await coordinator.async_load_cache(entry.entry_id):
+        # Entities come up from the cache right away; Arena may well still be booting.
+        entry.async_create_background_task(hass, coordinator.async_refresh(), "resolume_arena first refresh")
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    if not hass.data.get(f"{DOMAIN}_view_registered"):
+        hass.http.register_view(ResolumeThumbnailView(hass))
+        hass.data[f"{DOMAIN}_view_registered"] = True
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    await coordinator.async_start_push()
+    await coordinator.async_start_osc()
+    coordinator.async_start_polling()
+    entry.async_on_unload(coordinator.async_shutdown)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
+async def _async_options_updated(hass, entry):
+    """Reload so the coordinator picks up new options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass, entry):
     """Unload the integration."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+async def async_remove_entry(hass, entry):
+    """Forget the persisted composition of a deleted entry."""
+    await async_remove_cache(hass, entry.entry_id)
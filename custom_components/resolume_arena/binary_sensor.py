@@ -2,33 +2,37 @@
 import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from .const import DOMAIN
-from .helpers.entity import ResolumeEntity
+from .helpers.entity import ResolumeEntity, async_setup_dynamic_entities
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    """Create 'Bypass' and 'Solo' binary sensors per layer."""
+    """Create 'Bypass' and 'Solo' binary sensors per layer, following layers as they come and go."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    layers = coordinator.get_layers()
-    if not layers:
+    if not coordinator.get_layers():
         _LOGGER.warning("No layers found in Resolume composition.")
-        return
-    entities = []
-    for layer_id, layer_name in layers.items():
-        entities.append(ResolumeLayerBypassed(coordinator, layer_id, layer_name))
-        entities.append(ResolumeLayerSolo(coordinator, layer_id, layer_name))
-    async_add_entities(entities)
+    async_setup_dynamic_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        coordinator.get_layers,
+        lambda layer_id, layer_name: [
+            ResolumeLayerBypassed(coordinator, layer_id, layer_name),
+            ResolumeLayerSolo(coordinator, layer_id, layer_name),
+        ],
+    )
 
 class _BaseLayerBool(ResolumeEntity, BinarySensorEntity):
+    _unrecorded_attributes = frozenset({"layer_id"})
+
     def __init__(self, coordinator, layer_id, layer_name):
-        super().__init__(coordinator)
-        self._layer_id = layer_id
-        self._layer_name = layer_name
+        super().__init__(coordinator, layer_id)
         self._host = coordinator.host
 
     @property
     def extra_state_attributes(self):
-        return {"layer_name": self._layer_name, "layer_id": self._layer_id}
+        return {"layer_id": self._layer_id}
 
 class ResolumeLayerBypassed(_BaseLayerBool):
     _attr_icon = "mdi:minus-circle-outline"
@@ -40,8 +44,8 @@ class ResolumeLayerBypassed(_BaseLayerBool):
 
     @property
     def is_on(self):
-        layer_data = (self.coordinator.data.get(self._layer_id) or {}) if self.coordinator.data else {}
-        return bool(layer_data.get("is_bypassed", False))
+        state = self._layer_state
+        return bool(state and state.is_bypassed)
 
 class ResolumeLayerSolo(_BaseLayerBool):
     _attr_icon = "mdi:account-voice"
@@ -53,5 +57,5 @@ class ResolumeLayerSolo(_BaseLayerBool):
 
     @property
     def is_on(self):
-        layer_data = (self.coordinator.data.get(self._layer_id) or {}) if self.coordinator.data else {}
-        return bool(layer_data.get("is_solo", False))
+        state = self._layer_state
+        return bool(state and state.is_solo)
@@ -1,83 +1,84 @@
 """Button entities to trigger Resolume clips."""
 import logging
 from homeassistant.components.button import ButtonEntity
+from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_ICON
+from homeassistant.core import callback
 from .const import DOMAIN
-from .helpers.entity import ResolumeEntity
+from .helpers.entity import ResolumeEntity, async_setup_dynamic_entities
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    """Create one button per discovered clip slot."""
+    """Create one button per discovered clip slot, following slots as they come and go."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    clip_slots = coordinator.get_clip_slots()
-    if not clip_slots:
+    if not coordinator.get_clip_slots():
         _LOGGER.info("No clips found during initial scan (will retry on update).")
-    buttons = [
-        ResolumeClipButton(
-            coordinator,
-            slot["layer_id"],
-            slot["layer_name"],
-            slot["col_index"],
-            slot["clip_id"],
-            slot["clip_name"],
-        )
-        for slot in clip_slots
-    ]
-    async_add_entities(buttons)
+    async_setup_dynamic_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        coordinator.get_clip_slots,
+        lambda key, slot: [ResolumeClipButton(coordinator, slot)],
+    )
 
 class ResolumeClipButton(ResolumeEntity, ButtonEntity):
-    def __init__(self, coordinator, layer_id, layer_name, col_index, clip_id, clip_name):
-        super().__init__(coordinator)
-        self._layer_id = layer_id
-        self._layer_name = layer_name
-        self._col_index = col_index
-        self._clip_id = clip_id
-        self._clip_name = clip_name
+    # Static slot metadata, the per-restart thumbnail token and the icon (which mirrors
+    # is_active) would only bloat the recorder's attribute rows.
+    _unrecorded_attributes = frozenset({"layer_id", "column_index", "clip_id", ATTR_ENTITY_PICTURE, ATTR_ICON})
+
+    def __init__(self, coordinator, slot):
+        super().__init__(coordinator, slot.layer_id)
+        self._col_index = slot.col_index
+        self._slot = slot
         self._host = coordinator.host
-        self._port = coordinator.port
 
-        self._attr_name = f"Clip {layer_name} C{col_index} ({clip_name})"
-        self._attr_unique_id = f"resolume_{self._host}_clip_btn_{layer_id}_{col_index}"
+        self._attr_unique_id = f"resolume_{self._host}_clip_btn_{self._layer_id}_{self._col_index}"
+
+    @callback
+    def _handle_coordinator_update(self):
+        # The slot may now hold another clip (or a newly resolved name); the entity stays.
+        self._slot = self.coordinator.get_clip_slot(self._layer_id, self._col_index) or self._slot
+        super()._handle_coordinator_update()
+
+    @property
+    def _clip_id(self):
+        return self._slot.clip_id
+
+    @property
+    def name(self):
+        return f"Clip {self._slot.layer_name} C{self._col_index} ({self._slot.clip_name})"
 
-        if clip_id:
-            self._attr_entity_picture = (
-                f"http://{self._host}:{self._port}/api/v1/composition/clips/by-id/{clip_id}/thumbnail"
-            )
+    @property
+    def entity_picture(self):
+        if not self._clip_id:
+            return None
+        return self.coordinator.thumbnail_url(self._clip_id)
 
     @property
     def icon(self):
-        layer_data = self.coordinator.data.get(self._layer_id) if self.coordinator.data else None
-        if layer_data and layer_data.get("active_clip_id") == self._clip_id:
+        state = self._layer_state
+        if state and state.active_clip_id == self._clip_id:
             return "mdi:play-box"
         return "mdi:play-box-outline"
 
     @property
     def extra_state_attributes(self):
-        is_active = False
-        layer_data = self.coordinator.data.get(self._layer_id) if self.coordinator.data else None
-        if layer_data and layer_data.get("active_clip_id") == self._clip_id:
-            is_active = True
+        # Layer and clip names are already in the entity name, the host in the device.
+        state = self._layer_state
         return {
-            "is_active": is_active,
-            "layer_name": self._layer_name,
+            "is_active": bool(state and state.active_clip_id == self._clip_id),
             "layer_id": self._layer_id,
             "column_index": self._col_index,
             "clip_id": self._clip_id,
-            "clip_name": self._clip_name,
-            "host": self._host,
         }
 
     async def async_press(self):
         if not self._clip_id:
             _LOGGER.warning("No clip_id defined for this button, cannot trigger.")
             return
-        url = f"http://{self._host}:{self._port}/api/v1/composition/clips/by-id/{self._clip_id}/connect"
-        try:
-            async with self.coordinator.session.post(url, timeout=5) as response:
-                if response.status not in (200, 204):
-                    _LOGGER.error("Error triggering clip %s: %s", self._clip_id, response.status)
-                else:
-                    _LOGGER.info("Clip %s triggered.", self._clip_id)
-                    await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Exception triggering clip %s: %s", self._clip_id, err)
+        result = await self.coordinator.async_trigger_clip(self._layer_id, self._col_index)
+        if result["success"]:
+            _LOGGER.info("Clip %s triggered (%s).", self._clip_id, result["transport"])
+        else:
+            _LOGGER.error("Error triggering clip %s: %s", self._clip_id, result["error"])
@@ -5,9 +5,43 @@ from aiohttp import ClientError
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
 
-from .const import DOMAIN, DEFAULT_PORT
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    CONF_UPDATE_MODE,
+    DEFAULT_UPDATE_MODE,
+    UPDATE_MODE_LAYERS,
+    UPDATE_MODE_COMPOSITION,
+    SCAN_INTERVAL_SECONDS,
+    CONF_SCAN_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    CONF_BACKOFF_MAX,
+    DEFAULT_BACKOFF_MAX,
+    CONF_BOOST_WINDOW,
+    DEFAULT_BOOST_WINDOW,
+    CONF_OSC_ENABLED,
+    DEFAULT_OSC_ENABLED,
+    CONF_OSC_PORT,
+    DEFAULT_OSC_PORT,
+    CONF_OSC_FEEDBACK_PORT,
+    DEFAULT_OSC_FEEDBACK_PORT,
+    CONF_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT,
+    CONF_KEEPALIVE_TIMEOUT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    CONF_POLL_GROUP,
+    CONF_REQUEST_RATE,
+    DEFAULT_REQUEST_RATE,
+)
+from .helpers.api import composition_url
+from .helpers.session import async_get_host_session, async_release_host_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,25 +54,33 @@ DATA_SCHEMA = vol.Schema(
 
 async def validate_input(hass, data):
     """Check that the host/port speak the Resolume HTTP API."""
-    session = async_get_clientsession(hass)
-    url = f"http://{data[CONF_HOST]}:{data[CONF_PORT]}/api/v1/composition"
+    # Through the host's request layer, so probing a server already set up doesn't add to its load.
+    host_session = async_get_host_session(hass, data[CONF_HOST], data[CONF_PORT], {})
+    url = composition_url(data[CONF_HOST], data[CONF_PORT])
     try:
-        async with session.get(url, timeout=10) as response:
-            if response.status == 200:
-                return { "title": f"Resolume ({data[CONF_HOST]})" }
-            _LOGGER.error("Validation failed with status: %s", response.status)
-            raise ConnectionError(f"Invalid API response status: {response.status}")
+        response = await host_session.api.get(url, 10)
+        if response.status == 200:
+            return { "title": f"Resolume ({data[CONF_HOST]})" }
+        _LOGGER.error("Validation failed with status: %s", response.status)
+        raise ConnectionError(f"Invalid API response status: {response.status}")
     except ClientError as err:
         _LOGGER.error("Connection error during validation: %s", err)
         raise ConnectionError(f"Connection error: {err}") from err
     except Exception as err:
         _LOGGER.error("Unknown error during validation: %s", err)
         raise ConnectionError(f"Unknown error: {err}") from err
+    finally:
+        await async_release_host_session(hass, data[CONF_HOST], data[CONF_PORT])
 
 class ResolumeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the configuration flow."""
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return ResolumeOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Initial step for host/port."""
         errors = {}
@@ -55,3 +97,73 @@ class ResolumeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors=errors)
+
+class ResolumeOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
+    """Tune how the integration talks to Arena."""
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MAX_CONCURRENCY,
+                    default=options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                ): vol.All(int, vol.Range(min=1, max=64)),
+                vol.Required(
+                    CONF_UPDATE_MODE,
+                    default=options.get(CONF_UPDATE_MODE, DEFAULT_UPDATE_MODE),
+                ): vol.In([UPDATE_MODE_LAYERS, UPDATE_MODE_COMPOSITION]),
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+                vol.Required(
+                    CONF_FAST_SCAN_INTERVAL,
+                    default=options.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+                vol.Required(
+                    CONF_IDLE_SCAN_INTERVAL,
+                    default=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=3600)),
+                vol.Required(
+                    CONF_BACKOFF_MAX,
+                    default=options.get(CONF_BACKOFF_MAX, DEFAULT_BACKOFF_MAX),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=3600)),
+                vol.Required(
+                    CONF_BOOST_WINDOW,
+                    default=options.get(CONF_BOOST_WINDOW, DEFAULT_BOOST_WINDOW),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=600)),
+                vol.Required(
+                    CONF_OSC_ENABLED,
+                    default=options.get(CONF_OSC_ENABLED, DEFAULT_OSC_ENABLED),
+                ): bool,
+                vol.Required(
+                    CONF_OSC_PORT,
+                    default=options.get(CONF_OSC_PORT, DEFAULT_OSC_PORT),
+                ): vol.All(int, vol.Range(min=1, max=65535)),
+                vol.Required(
+                    CONF_OSC_FEEDBACK_PORT,
+                    default=options.get(CONF_OSC_FEEDBACK_PORT, DEFAULT_OSC_FEEDBACK_PORT),
+                ): vol.All(int, vol.Range(min=0, max=65535)),
+                vol.Required(
+                    CONF_CONNECTION_LIMIT,
+                    default=options.get(CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT),
+                ): vol.All(int, vol.Range(min=1, max=64)),
+                vol.Required(
+                    CONF_KEEPALIVE_TIMEOUT,
+                    default=options.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_REQUEST_RATE,
+                    default=options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=500)),
+                vol.Optional(
+                    CONF_POLL_GROUP,
+                    default=options.get(CONF_POLL_GROUP, ""),
+                ): str,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,4 +1,68 @@
 DOMAIN = "resolume_arena"
 DEFAULT_PORT = 8080
 SCAN_INTERVAL_SECONDS = 2
+FALLBACK_SCAN_INTERVAL_SECONDS = 30
+REDISCOVERY_INTERVAL_SECONDS = 60
+# After a trigger, wait this long (coalescing further triggers) before re-reading the layers.
+TRIGGER_VERIFY_DELAY_SECONDS = 0.5
+WS_RECONNECT_MIN_SECONDS = 1
+WS_RECONNECT_MAX_SECONDS = 60
 API_BASE = "/api/v1"
+
+CONF_MAX_CONCURRENCY = "max_concurrency"
+DEFAULT_MAX_CONCURRENCY = 8
+
+CONF_UPDATE_MODE = "update_mode"
+UPDATE_MODE_LAYERS = "layers"            # one GET per layer
+UPDATE_MODE_COMPOSITION = "composition"  # one GET of /composition per cycle
+DEFAULT_UPDATE_MODE = UPDATE_MODE_LAYERS
+
+# Optional OSC transport: commands go to Arena's OSC input port, its OSC output comes back
+# on the feedback port (0 = send only).
+CONF_OSC_ENABLED = "osc_enabled"
+DEFAULT_OSC_ENABLED = False
+CONF_OSC_PORT = "osc_port"
+DEFAULT_OSC_PORT = 7000
+CONF_OSC_FEEDBACK_PORT = "osc_feedback_port"
+DEFAULT_OSC_FEEDBACK_PORT = 7001
+
+# Payloads above this size are decoded in the executor instead of on the event loop.
+DECODE_EXECUTOR_THRESHOLD_BYTES = 256 * 1024
+
+# Connection pool of each Arena host, shared by every entry pointing at it.
+CONF_CONNECTION_LIMIT = "connection_limit"
+DEFAULT_CONNECTION_LIMIT = 8
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_SECONDS = 300
+# Requests per second to one Arena host, triggers first when callers queue (0: unlimited).
+CONF_REQUEST_RATE = "request_rate"
+DEFAULT_REQUEST_RATE = 0
+
+# Entries sharing a poll group name are polled by one staggered driver.
+CONF_POLL_GROUP = "poll_group"
+
+CLIP_NAME_TTL_SECONDS = 3600
+CLIP_NAME_CACHE_SIZE = 4096
+CLIP_NAME_RETRY_MIN_SECONDS = 10
+CLIP_NAME_RETRY_MAX_SECONDS = 600
+# Background name lookups in flight at once, apart from the poll's own cap.
+CLIP_NAME_CONCURRENCY = 2
+
+CONF_SCAN_INTERVAL = "scan_interval"            # base interval, defaults to SCAN_INTERVAL_SECONDS
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"  # right after a button press or a change
+DEFAULT_FAST_SCAN_INTERVAL = 1
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"  # ceiling while nothing changes
+DEFAULT_IDLE_SCAN_INTERVAL = 30
+CONF_BACKOFF_MAX = "backoff_max"                # ceiling while Arena is unreachable
+DEFAULT_BACKOFF_MAX = 120
+CONF_BOOST_WINDOW = "boost_window"              # how long the fast interval lasts
+DEFAULT_BOOST_WINDOW = 20
+
+# Discovered layers, slots and clip names, persisted so setup doesn't wait for Arena.
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY_SECONDS = 10
+
+THUMBNAIL_CACHE_SIZE = 512
+THUMBNAIL_CACHE_BYTES = 32 * 1024 * 1024
+THUMBNAIL_REVALIDATE_SECONDS = 60
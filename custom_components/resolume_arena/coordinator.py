@@ -1,41 +1,166 @@
 """DataUpdateCoordinator for the Resolume Arena integration."""
+import asyncio
 import logging
+import re
+import secrets
+import time
 from datetime import timedelta
 from aiohttp import ClientError
 
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, SCAN_INTERVAL_SECONDS
-from .helpers.api import composition_url, layer_by_id_url, clip_by_id_url
+from .const import (
+    DOMAIN,
+    SCAN_INTERVAL_SECONDS,
+    FALLBACK_SCAN_INTERVAL_SECONDS,
+    CLIP_NAME_CONCURRENCY,
+    CONF_SCAN_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    CONF_BACKOFF_MAX,
+    DEFAULT_BACKOFF_MAX,
+    CONF_BOOST_WINDOW,
+    DEFAULT_BOOST_WINDOW,
+    REDISCOVERY_INTERVAL_SECONDS,
+    DECODE_EXECUTOR_THRESHOLD_BYTES,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY_SECONDS,
+    TRIGGER_VERIFY_DELAY_SECONDS,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    CONF_UPDATE_MODE,
+    DEFAULT_UPDATE_MODE,
+    UPDATE_MODE_COMPOSITION,
+    CONF_OSC_ENABLED,
+    DEFAULT_OSC_ENABLED,
+    CONF_OSC_PORT,
+    DEFAULT_OSC_PORT,
+    CONF_OSC_FEEDBACK_PORT,
+    DEFAULT_OSC_FEEDBACK_PORT,
+    CONF_POLL_GROUP,
+)
+from .helpers.api import (
+    composition_url,
+    layer_by_id_url,
+    layer_clear_url,
+    column_connect_url,
+    clip_by_id_url,
+    clip_connect_url,
+    websocket_url,
+    PRIORITY_TRIGGER,
+    PRIORITY_POLL,
+    PRIORITY_BACKGROUND,
+)
+from .helpers.composition import get_value, iter_layers, layer_clips, param_name, parse_layer_state
+from .helpers.decode import decode_clip, decode_composition, decode_layer
+from .helpers.clip_names import ClipNameResolver
+from .helpers.metrics import CoordinatorMetrics
+from .helpers.model import CompositionModel
+from .helpers.osc import ResolumeOscClient
+from .helpers.poll_group import async_join_poll_group, async_leave_poll_group
+from .helpers.scheduler import AdaptiveScheduler
+from .helpers.session import async_get_host_session, async_release_host_session
+from .helpers.thumbnails import ThumbnailCache
+from .helpers.websocket import ResolumePushClient
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=SCAN_INTERVAL_SECONDS)
+
+# Arena's OSC output for the layer parameters we mirror.
+_OSC_LAYER_ADDRESS = re.compile(r"^/composition/layers/(\d+)/(bypassed|solo|clips/(\d+)/connected)$")
+# OSC "connected" values: 0 empty, 1 disconnected, 2 previewing, 3 connected, 4 connected & previewing.
+_OSC_CONNECTED = 3
+
+def _fingerprint(structure):
+    """Cheap identity of the composition layout: [(layer_id, full_name, [(col, clip_id)])]."""
+    return hash(tuple((layer_id, name, tuple(clips)) for layer_id, name, clips in structure))
+
+def _cache_store(hass, entry_id):
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+async def async_remove_cache(hass, entry_id):
+    """Delete an entry's persisted composition."""
+    await _cache_store(hass, entry_id).async_remove()
 
 class ResolumeDataUpdateCoordinator(DataUpdateCoordinator):
-    """Periodically pulls state from Resolume's HTTP API."""
+    """Pulls state from Resolume's HTTP API and applies websocket pushes on top."""
 
-    def __init__(self, hass, host, port):
+    def __init__(self, hass, host, port, options=None):
+        options = options or {}
         self.host = host
         self.port = port
-        self.session = async_get_clientsession(hass)
+        self.host_session = async_get_host_session(hass, host, port, options)
+        self.session = self.host_session.session
+        self.api = self.host_session.api
+        self._session_released = False
+        self.update_mode = options.get(CONF_UPDATE_MODE, DEFAULT_UPDATE_MODE)
+        # Caps in-flight GETs per cycle so large compositions don't flood Arena's webserver.
+        self._request_limit = asyncio.Semaphore(options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY))
+        # Name lookups get their own cap so a backlog of them never queues ahead of a poll.
+        self._lookup_limit = asyncio.Semaphore(CLIP_NAME_CONCURRENCY)
 
         self._layers = {}          # {layer_id: layer_name}
-        self._clip_slots = []      # [{layer_id, layer_name, col_index, clip_id, clip_name}]
-        self._clip_name_cache = {} # {clip_id: clip_name}
+        self._model = CompositionModel()
+        self.metrics = CoordinatorMetrics()
+        self._clip_names = ClipNameResolver(
+            hass, self._async_fetch_clip_name, self._handle_clip_names_resolved, self.metrics
+        )
+        self._param_index = {}     # {param_id: (layer_id, field, clip_id)} for websocket pushes
+        self._changed_layers = None  # layers the next notification is about; None = notify everyone
+        self._fingerprint = None     # hash of layer ids/names and clip ids per column
+        self._structure_version = None
+        self._structure_changed = False
+        self._structure_listeners = []
+        self._last_discovery = 0.0
+        self.dispatch_stats = {"diff_ms": 0.0, "changed_layers": 0, "writes": 0, "suppressed_writes": 0}
+        self._push = None
+        self._osc = None
+        if options.get(CONF_OSC_ENABLED, DEFAULT_OSC_ENABLED):
+            self._osc = ResolumeOscClient(
+                host,
+                options.get(CONF_OSC_PORT, DEFAULT_OSC_PORT),
+                options.get(CONF_OSC_FEEDBACK_PORT, DEFAULT_OSC_FEEDBACK_PORT),
+                self._handle_osc_message,
+            )
+        self._osc_layers = {}      # {layer_id: 1-based OSC layer index}
+        self._osc_layer_ids = {}   # {OSC layer index: layer_id}
+        self._trigger_sent = {}    # {layer_id: (clip_id, transport, perf_counter)} awaiting Arena's report
+        self._store = None
+        self._pending_triggers = {}  # {layer_id: clip_id} shown optimistically, awaiting verification
+        self._verify_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=TRIGGER_VERIFY_DELAY_SECONDS, immediate=False,
+            function=self._async_verify_triggers,
+        )
+        self._scheduler = AdaptiveScheduler(
+            base=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS),
+            fast=options.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+            idle_interval=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+            backoff_max=options.get(CONF_BACKOFF_MAX, DEFAULT_BACKOFF_MAX),
+            boost_window=options.get(CONF_BOOST_WINDOW, DEFAULT_BOOST_WINDOW),
+        )
+        self.thumbnails = ThumbnailCache(hass, self.api, self.metrics)
+        self.thumbnail_token = secrets.token_urlsafe(16)
         self.composition_name = f"Resolume ({host})"
-
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
+        # Grouped coordinators don't run their own timer; the group's driver refreshes them.
+        self.poll_group_name = options.get(CONF_POLL_GROUP) or None
+        self.poll_group = None
+        self._interval = self._scheduler.interval
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=None if self.poll_group_name else timedelta(seconds=self._interval),
+        )
 
     def _get_value(self, param_obj, default=None):
         """Safely read .value out of Resolume params, with sensible fallbacks."""
-        if isinstance(param_obj, dict):
-            val = param_obj.get("value", default)
-            return val if val is not None else default
-        if param_obj is None:
-            return default
-        return param_obj
+        return get_value(param_obj, default)
 
     @property
     def device_info(self):
@@ -48,138 +173,767 @@ class ResolumeDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
     def get_layers(self):
-        """Public copy of discovered layers mapping."""
-        return dict(self._layers)
+        """Discovered {layer_id: layer_name}; shared with the coordinator, don't mutate."""
+        return self._layers
 
     def get_clip_slots(self):
-        """Public copy of discovered clip slots."""
-        return list(self._clip_slots)
+        """Discovered {(layer_id, col_index): ClipSlot}; shared with the coordinator, don't mutate."""
+        return self._model.slots
+
+    def get_clip_slot(self, layer_id, col_index):
+        """Current slot at a layer/column, or None."""
+        return self._model.slots.get((layer_id, col_index))
+
+    def thumbnail_url(self, clip_id):
+        """Path of a clip's thumbnail on the Home Assistant proxy."""
+        return f"/api/resolume_arena/thumbnail/{self.config_entry.entry_id}/{clip_id}?token={self.thumbnail_token}"
+
+    def _after_slots_updated(self):
+        """Invalidate thumbnails of replaced clips, prune caches, queue missing names."""
+        for old_clip_id, new_clip_id in self._model.replaced_clips:
+            self.thumbnails.invalidate(old_clip_id)
+            self.thumbnails.invalidate(new_clip_id)
+        self._model.replaced_clips.clear()
+
+        if self._model.structure_version != self._structure_version:
+            clip_ids = {slot.clip_id for slot in self._model.slots.values() if slot.clip_id}
+            self._clip_names.retain(clip_ids)
+            self.thumbnails.retain(clip_ids)
+        # Names are looked up in the background; until then slots show "Clip N".
+        self._clip_names.request(slot.clip_id for slot in self._model.slots.values() if slot.unresolved)
+
+    @callback
+    def _handle_clip_names_resolved(self, names):
+        """Patch freshly resolved names into slots and active-clip states."""
+        changed = set()
+        for slot in self._model.slots.values():
+            name = names.get(slot.clip_id)
+            if name and (name != slot.clip_name or slot.unresolved):
+                slot.clip_name = name
+                slot.unresolved = False
+                changed.add(slot.layer_id)
+        for state in self._model.layers.values():
+            name = names.get(state.active_clip_id)
+            if name and state.active_clip_name == "Unnamed Clip":
+                state.active_clip_name = name
+                changed.add(state.layer_id)
+        if changed:
+            self._async_schedule_save()
+            self.async_notify_layers(changed)
+
+    @callback
+    def async_notify_layers(self, layer_ids):
+        """Notify only the entities bound to these layers (plus layer-less ones)."""
+        self._changed_layers = set(layer_ids)
+        self.async_update_listeners()
+
+    @callback
+    def async_add_structure_listener(self, update_callback):
+        """Call back platforms when layers or clip slots appear/disappear; returns a remover."""
+        self._structure_listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._structure_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self):
+        """Skip entities whose layer didn't change; their state write would be a no-op."""
+        if self._structure_changed:
+            # Platforms add/remove entities first, so new ones render from the fresh data.
+            self._structure_changed = False
+            for structure_callback in list(self._structure_listeners):
+                structure_callback()
+
+        changed, self._changed_layers = self._changed_layers, None
+        writes = suppressed = 0
+        with self.metrics.phase("dispatch"):
+            for update_callback, context in list(self._listeners.values()):
+                if changed is None or context is None or context in changed:
+                    update_callback()
+                    writes += 1
+                else:
+                    suppressed += 1
+        self.dispatch_stats["writes"] += writes
+        self.dispatch_stats["suppressed_writes"] += suppressed
+
+    def _check_structure(self):
+        """Flag a structural change when the composition's fingerprint moved."""
+        if self._model.structure_version == self._structure_version:
+            return
+        self._structure_version = self._model.structure_version
+        fingerprint = _fingerprint(
+            (layer_id, name, [(slot.col_index, slot.clip_id) for slot in self._model.slots_of(layer_id)])
+            for layer_id, name in self._layers.items()
+        )
+        if fingerprint == self._fingerprint:
+            return
+        if self._fingerprint is not None:
+            _LOGGER.info("Resolume composition structure changed, syncing entities.")
+            self._structure_changed = True
+        self._fingerprint = fingerprint
+        self._async_schedule_save()
+
+    async def async_load_cache(self, entry_id):
+        """Rebuild layers and slots from the last persisted composition; True if there was one.
+
+        Restored layers are stale, so their entities exist but stay unavailable until
+        Arena answers.
+        """
+        self._store = _cache_store(self.hass, entry_id)
+        cached = await self._store.async_load()
+        if not cached or not cached.get("layers"):
+            return False
+
+        self.composition_name = cached.get("composition_name", self.composition_name)
+        self._clip_names.preload({int(clip_id): name for clip_id, name in cached.get("clip_names", {}).items()})
+        self._layers = {layer["id"]: layer["name"] for layer in cached["layers"]}
+        for layer in cached["layers"]:
+            self._model.mark_stale(layer["id"])
+            self._model.update_slots(layer["id"], layer["name"], [tuple(slot) for slot in layer["slots"]])
+        self._check_structure()
+        self.data = self._model.layers
+        _LOGGER.debug("Resolume: %s layers restored from cache.", len(self._layers))
+        return True
+
+    @callback
+    def _async_schedule_save(self):
+        if self._store is not None:
+            self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _cache_data(self):
+        return {
+            "composition_name": self.composition_name,
+            "layers": [
+                {
+                    "id": layer_id,
+                    "name": name,
+                    "slots": [
+                        [slot.col_index, slot.clip_id, slot.clip_name, slot.unresolved]
+                        for slot in self._model.slots_of(layer_id)
+                    ],
+                }
+                for layer_id, name in self._layers.items()
+            ],
+            "clip_names": self._clip_names.names(),
+        }
+
+    async def async_start_push(self):
+        """Open the websocket; polling drops to a slow resync while it is up."""
+        if self._push is None:
+            self._push = ResolumePushClient(
+                self.session,
+                websocket_url(self.host, self.port),
+                self._handle_push_message,
+                self._handle_push_connection,
+            )
+        self._push.start(self.hass)
+
+    async def async_start_osc(self):
+        """Open the OSC socket if the OSC transport is enabled."""
+        if self._osc is not None and not self._osc.ready:
+            await self._osc.async_start()
+
+    @property
+    def osc_status(self):
+        return {
+            "enabled": self._osc is not None,
+            "ready": self._osc is not None and self._osc.ready,
+            "listening": self._osc is not None and self._osc.listening,
+            "addressable_layers": len(self._osc_layers),
+        }
+
+    async def async_shutdown(self):
+        """Stop the websocket, OSC and background lookups along with the poll timer."""
+        if self._push is not None:
+            await self._push.stop()
+        if self._osc is not None:
+            await self._osc.async_stop()
+        if self.poll_group is not None:
+            async_leave_poll_group(self.hass, self.poll_group, self)
+            self.poll_group = None
+        await self._clip_names.async_stop()
+        self._verify_debouncer.async_cancel()
+        await super().async_shutdown()
+        # Runs both from the entry's unload hook and the coordinator's own; release only once.
+        if not self._session_released:
+            self._session_released = True
+            await async_release_host_session(self.hass, self.host, self.port)
+
+    @callback
+    def async_clip_triggered(self, layer_id, clip_id):
+        """Arena accepted a trigger: show it now, confirm it with a single-layer read shortly after."""
+        self.async_note_activity()
+        state = self._model.layers.get(layer_id)
+        if state is None:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        self._pending_triggers[layer_id] = clip_id
+        self._apply_optimistic({layer_id: clip_id})
+        self.hass.async_create_task(self._verify_debouncer.async_call())
+
+    @callback
+    def _apply_optimistic(self, active_clips):
+        """Show {layer_id: clip_id or None} as playing right away, notifying only those layers."""
+        changed = set()
+        for layer_id, clip_id in active_clips.items():
+            state = self._model.layers.get(layer_id)
+            if state is None or state.active_clip_id == clip_id:
+                continue
+            state.active_clip_id = clip_id
+            state.active_clip_name = self._slot_clip_name(layer_id, clip_id) if clip_id else "Empty"
+            changed.add(layer_id)
+        if changed:
+            self.metrics.optimistic_updates += len(changed)
+            self.async_notify_layers(changed)
+
+    async def _async_verify_triggers(self):
+        """Re-read the layers triggered since the last run and undo what Arena didn't do."""
+        pending, self._pending_triggers = self._pending_triggers, {}
+        layers = [(layer_id, self._layers.get(layer_id)) for layer_id in pending if layer_id in self._layers]
+        results = await asyncio.gather(
+            *(self._async_fetch_layer(layer_id, layer_name) for layer_id, layer_name in layers),
+            return_exceptions=True,
+        )
+
+        changed = set()
+        for (layer_id, layer_name), result in zip(layers, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                # Can't tell what Arena is playing; let the next full poll settle it.
+                _LOGGER.debug("Could not verify trigger on layer %s: %s", layer_id, result)
+                self.hass.async_create_task(self.async_request_refresh())
+                continue
+            if self._apply_layer(layer_id, layer_name, *result):
+                changed.add(layer_id)
+            if self._model.layers[layer_id].active_clip_id != pending[layer_id]:
+                self.metrics.rollbacks += 1
+                _LOGGER.debug("Arena isn't playing clip %s on layer %s, rolled back.", pending[layer_id], layer_id)
+
+        if changed:
+            self._after_slots_updated()
+            self._check_structure()
+            self.async_notify_layers(changed)
+
+    async def async_trigger_clip(self, layer_id, col_index):
+        """Connect the clip in one slot, showing it right away; returns its result."""
+        result = (await self._async_connect_slots([(layer_id, col_index)]))[0]
+        if result["success"]:
+            self.async_clip_triggered(layer_id, result["clip_id"])
+        return result
+
+    async def async_trigger_clips(self, targets):
+        """Connect clips given as clip ids or (layer_id, column) pairs; one result per target."""
+        results = await self._async_connect_slots(targets)
+        await self._async_after_commands(
+            {result["layer_id"]: result["clip_id"] for result in results if result["success"]}
+        )
+        return results
+
+    async def async_trigger_column(self, column):
+        """Connect a whole column, clip by clip if this Arena has no column endpoint."""
+        slots = [slot for slot in self._model.slots.values() if slot.col_index == column and slot.clip_id]
+        try:
+            transport, status = await self._async_send(
+                "column_connect",
+                column_connect_url(self.host, self.port, column),
+                f"/composition/columns/{column}/connect",
+            )
+        except (ClientError, asyncio.TimeoutError) as err:
+            transport, status, error = "http", None, str(err) or type(err).__name__
+        else:
+            error = None if status in (None, 200, 204) else f"HTTP {status}"
+
+        if status in (404, 405):
+            results = await self._async_connect_slots([(slot.layer_id, slot.col_index) for slot in slots])
+        else:
+            results = []
+            for slot in slots:
+                result = {
+                    "layer_id": slot.layer_id,
+                    "column": column,
+                    "clip_id": slot.clip_id,
+                    "transport": transport,
+                    "success": not error,
+                }
+                if error:
+                    result["error"] = error
+                results.append(result)
+        await self._async_after_commands(
+            {result["layer_id"]: result["clip_id"] for result in results if result["success"]}
+        )
+        return results
+
+    async def async_clear_layers(self, layer_ids=None):
+        """Clear the given layers (all of them by default); one result per layer."""
+        layer_ids = list(self._model.layers) if layer_ids is None else layer_ids
+        results = []
+        commands = []
+        for layer_id in layer_ids:
+            result = {"layer_id": layer_id}
+            results.append(result)
+            if layer_id not in self._model.layers:
+                result.update(success=False, error="unknown layer")
+                continue
+            commands.append((
+                result,
+                "layer_clear",
+                layer_clear_url(self.host, self.port, layer_id),
+                self._osc_layer_address(layer_id, "clear"),
+            ))
+        await self._async_run_commands(commands)
+        await self._async_after_commands({result["layer_id"]: None for result in results if result["success"]})
+        return results
+
+    async def _async_connect_slots(self, targets):
+        """Connect every target found in the slot index."""
+        by_clip_id = {slot.clip_id: slot for slot in self._model.slots.values() if slot.clip_id}
+        results = []
+        commands = []
+        for target in targets:
+            slot = self._model.slots.get(target) if isinstance(target, tuple) else by_clip_id.get(target)
+            if slot is None or not slot.clip_id:
+                if isinstance(target, tuple):
+                    result = {"layer_id": target[0], "column": target[1], "clip_id": None}
+                else:
+                    result = {"layer_id": None, "column": None, "clip_id": target}
+                result.update(success=False, error="unknown clip")
+                results.append(result)
+                continue
+            result = {"layer_id": slot.layer_id, "column": slot.col_index, "clip_id": slot.clip_id}
+            results.append(result)
+            commands.append((
+                result,
+                "clip_connect",
+                clip_connect_url(self.host, self.port, slot.clip_id),
+                self._osc_layer_address(slot.layer_id, f"clips/{slot.col_index}/connect"),
+            ))
+
+        # Stamped before sending: Arena may report the change before the POST returns.
+        sent_at = time.perf_counter()
+        for result, _endpoint, _url, osc_address in commands:
+            transport = "osc" if osc_address is not None and self._osc is not None and self._osc.ready else "http"
+            self._trigger_sent[result["layer_id"]] = (result["clip_id"], transport, sent_at)
+        await self._async_run_commands(commands)
+        for result in results:
+            if not result["success"]:
+                self._trigger_sent.pop(result["layer_id"], None)
+        return results
+
+    async def _async_run_commands(self, commands):
+        """Send [(result, endpoint, url, osc_address)] concurrently, filling in each result."""
+        outcomes = await asyncio.gather(
+            *(self._async_send(endpoint, url, osc_address) for _result, endpoint, url, osc_address in commands),
+            return_exceptions=True,
+        )
+        for (result, _endpoint, _url, _osc_address), outcome in zip(commands, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                result.update(transport="http", success=False, error=str(outcome) or type(outcome).__name__)
+                continue
+            transport, status = outcome
+            result["transport"] = transport
+            if status in (None, 200, 204):
+                result["success"] = True
+            else:
+                result.update(success=False, error=f"HTTP {status}")
+
+    async def _async_send(self, endpoint, url, osc_address=None):
+        """Send a command over OSC when Arena can be addressed that way, else POST it.
+
+        Returns (transport, HTTP status); OSC is fire-and-forget, so its status is None.
+        """
+        if osc_address is not None and self._osc is not None and self._osc.ready:
+            with self.metrics.request(f"osc_{endpoint}"):
+                self._osc.send(osc_address, 1)
+            return "osc", None
+        return "http", await self._async_post(endpoint, url)
+
+    def _osc_layer_address(self, layer_id, path):
+        index = self._osc_layers.get(layer_id)
+        return f"/composition/layers/{index}/{path}" if index is not None else None
+
+    async def _async_after_commands(self, active_clips):
+        """Show what a batch did, then confirm it all with a single refresh."""
+        self._apply_optimistic(active_clips)
+        self.async_note_activity()
+        await self.async_request_refresh()
+
+    async def _async_post(self, endpoint, url):
+        """POST a command to Arena and record it under ``endpoint``; returns the HTTP status.
+
+        Commands skip the poll concurrency limit; the host's rate limit serves them first.
+        """
+        with self.metrics.request(endpoint) as sample:
+            status = await self.api.post(url, 5, PRIORITY_TRIGGER)
+            sample.ok = status in (200, 204)
+            return status
+
+    def _slot_clip_name(self, layer_id, clip_id):
+        return next(
+            (slot.clip_name for slot in self._model.slots_of(layer_id) if slot.clip_id == clip_id),
+            "Unnamed Clip",
+        )
+
+    @property
+    def push_connected(self):
+        return self._push is not None and self._push.connected
+
+    @property
+    def current_interval(self):
+        """Effective seconds between polls."""
+        return self._interval
+
+    @callback
+    def async_start_polling(self):
+        """Hand polling to the entry's poll group, if it has one."""
+        if self.poll_group_name and self.poll_group is None:
+            self.poll_group = async_join_poll_group(self.hass, self.poll_group_name, self)
+
+    @callback
+    def async_note_activity(self):
+        """A user acted on Arena: poll fast for a while (unless pushes already cover it)."""
+        self._scheduler.note_activity()
+        self._apply_interval()
+
+    @callback
+    def _apply_interval(self):
+        interval = self._scheduler.interval
+        if self.push_connected:
+            # Pushes carry live changes; polling is only a resync (or a backoff, if slower).
+            interval = max(interval, FALLBACK_SCAN_INTERVAL_SECONDS)
+        self._interval = interval
+        if not self.poll_group_name:
+            self.update_interval = timedelta(seconds=interval)
+
+    @callback
+    def _handle_push_connection(self, connected):
+        self._apply_interval()
+        # Whatever happened while the socket was down (or before it came up) is unknown: resync.
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_push_message(self, message):
+        self.metrics.push_messages += 1
+        msg_type = message.get("type")
+        if msg_type in ("parameter_update", "parameter_subscribed"):
+            self._apply_parameter_update(message)
+        elif "layers" in message or "layergroups" in message:
+            # Arena sends the whole composition on connect and whenever its structure changes.
+            self._index_push_composition(message)
+
+    @callback
+    def _index_push_composition(self, composition):
+        index = {}
+        structure = []
+        for layer, full_name in iter_layers(composition):
+            layer_id = layer["id"]
+            structure.append((
+                layer_id,
+                full_name,
+                [(idx, clip.get("id")) for idx, clip in enumerate(layer_clips(layer), start=1) if clip],
+            ))
+            for field in ("bypassed", "solo"):
+                param = layer.get(field)
+                if isinstance(param, dict) and param.get("id"):
+                    index[param["id"]] = (layer_id, field, None)
+            for clip in layer_clips(layer):
+                if not isinstance(clip, dict):
+                    continue
+                param = clip.get("connected")
+                if isinstance(param, dict) and param.get("id") and clip.get("id"):
+                    index[param["id"]] = (layer_id, "connected", clip["id"])
+        self._param_index = index
+        self._index_osc_layers(composition)
+
+        if self._fingerprint is not None and _fingerprint(structure) != self._fingerprint:
+            _LOGGER.info("Resolume composition changed, rediscovering layers.")
+            self._last_discovery = 0.0
+            self.hass.async_create_task(self.async_request_refresh())
+
+        if self._push is not None:
+            self.hass.async_create_task(self._push.subscribe(list(index)))
+
+    @callback
+    def _apply_parameter_update(self, message):
+        target = self._param_index.get(message.get("id"))
+        if target is None:
+            return
+        layer_id, field, clip_id = target
+        value = message.get("value")
+        if field == "connected":
+            value = isinstance(value, str) and value.startswith("Connected")
+        self._apply_remote_change(layer_id, field, clip_id, bool(value))
+
+    @callback
+    def _handle_osc_message(self, address, args):
+        self.metrics.osc_messages += 1
+        match = _OSC_LAYER_ADDRESS.match(address)
+        # Anything can reach the feedback port: only numeric (or T/F) values are Arena's.
+        if match is None or not args or not isinstance(args[0], (int, float)):
+            return
+        layer_id = self._osc_layer_ids.get(int(match[1]))
+        if layer_id is None:
+            return
+        value = args[0]
+        if match[3] is None:
+            self._apply_remote_change(layer_id, match[2], None, bool(value))
+            return
+        slot = self._model.slots.get((layer_id, int(match[3])))
+        if slot is not None and slot.clip_id:
+            self._apply_remote_change(layer_id, "connected", slot.clip_id, value >= _OSC_CONNECTED)
+
+    @callback
+    def _apply_remote_change(self, layer_id, field, clip_id, value):
+        """Apply a parameter Arena reported (websocket or OSC) to one layer's state."""
+        state = self._model.layers.get(layer_id)
+        if state is None:
+            return
+
+        if field == "bypassed":
+            changed = state.is_bypassed != value
+            state.is_bypassed = value
+        elif field == "solo":
+            changed = state.is_solo != value
+            state.is_solo = value
+        elif value:
+            sent = self._trigger_sent.get(layer_id)
+            if sent is not None and sent[0] == clip_id:
+                del self._trigger_sent[layer_id]
+                self.metrics.observe(f"trigger_{sent[1]}_to_feedback", (time.perf_counter() - sent[2]) * 1000)
+            changed = state.active_clip_id != clip_id
+            if changed:
+                state.active_clip_id = clip_id
+                state.active_clip_name = self._slot_clip_name(layer_id, clip_id)
+        else:
+            changed = state.active_clip_id == clip_id
+            if changed:
+                state.active_clip_id = None
+                state.active_clip_name = "Empty"
+
+        if not changed:
+            return
+        self._scheduler.note_activity()
+        # Not async_set_updated_data: that reschedules the refresh, and a steady stream of
+        # pushes would then keep the slow resync poll from ever running.
+        self.data = self._model.layers
+        self.async_notify_layers({layer_id})
+
+    async def _async_get_json(self, endpoint, url, timeout, decode, priority=PRIORITY_POLL, limit=None):
+        """GET a JSON document, record it under ``endpoint`` and decode it; (status, document or None).
+
+        Large bodies are decoded in the executor so a big deck doesn't stall the event loop.
+        ``limit`` is the semaphore bounding this kind of request, taken only while it is sent.
+        """
+        with self.metrics.request(endpoint) as sample:
+            response = await self.api.get(url, timeout, priority, limit=limit)
+            sample.coalesced = response.coalesced
+            if response.status != 200:
+                sample.ok = False
+                return response.status, None
+            body = response.body
+            sample.size = len(body)
+
+        if len(body) > DECODE_EXECUTOR_THRESHOLD_BYTES:
+            with self.metrics.phase("decode_executor"):
+                return 200, await self.hass.async_add_executor_job(decode, body)
+        with self.metrics.phase("decode"):
+            return 200, decode(body)
+
+    async def _async_fetch_composition(self):
+        """GET the full composition document."""
+        try:
+            status, composition = await self._async_get_json(
+                "composition", composition_url(self.host, self.port), 10, decode_composition
+            )
+        except (ClientError, asyncio.TimeoutError) as err:
+            raise UpdateFailed(f"Connection Error (Composition): {err!r}")
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid JSON (Composition): {err}")
+        if composition is None:
+            raise UpdateFailed(f"API Error (Composition): {status}")
+        return composition
+
+    def _index_layers(self, composition):
+        """Refresh the composition name and the {layer_id: layer_name} map; returns (layer, name) pairs."""
+        self.composition_name = self._get_value(composition.get("name", {}), f"Resolume ({self.host})")
+        self._index_osc_layers(composition)
+        entries = list(iter_layers(composition))
+        layers = {layer["id"]: full_name for layer, full_name in entries}
+        if layers != self._layers:
+            self._layers = layers
+            self._model.structure_version += 1
+        return entries
+
+    def _index_osc_layers(self, composition):
+        """OSC addresses layers by position, which the document only gives when no layer is grouped."""
+        if self._osc is None:
+            return
+        layers = {}
+        if not get_value(composition.get("layergroups"), []):
+            for index, layer in enumerate(get_value(composition.get("layers"), []), start=1):
+                if isinstance(layer, dict) and layer.get("id"):
+                    layers[layer["id"]] = index
+        self._osc_layers = layers
+        self._osc_layer_ids = {index: layer_id for layer_id, index in layers.items()}
 
     async def _async_discover_layers(self):
         """Discover all layers (including nested groups)."""
         try:
-            async with self.session.get(composition_url(self.host, self.port), timeout=10) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"API Error (Composition): {response.status}")
-                composition = await response.json()
-
-                comp_name_param = composition.get("name", {})
-                self.composition_name = self._get_value(comp_name_param, f"Resolume ({self.host})")
-
-                self._layers.clear()
-
-                def process_item(item, group_name=""):
-                    if not isinstance(item, dict):
-                        return
-                    if "clips" in item:  # it's a Layer
-                        layer_id = item.get("id")
-                        if layer_id and layer_id not in self._layers:
-                            layer_name = self._get_value(item.get("name"), f"Layer {layer_id}")
-                            full_name = f"{group_name} - {layer_name}" if group_name else layer_name
-                            self._layers[layer_id] = full_name
-                    elif "layers" in item or "layergroups" in item:  # it's a Group
-                        current_group_name = self._get_value(item.get("name"), "Group")
-                        nested_group_name = f"{group_name} - {current_group_name}" if group_name else current_group_name
-                        for layer in self._get_value(item.get("layers"), []):
-                            process_item(layer, nested_group_name)
-                        for subgroup in self._get_value(item.get("layergroups"), []):
-                            process_item(subgroup, nested_group_name)
-
-                for it in self._get_value(composition.get("layers"), []):
-                    process_item(it)
-                for it in self._get_value(composition.get("layergroups"), []):
-                    process_item(it)
-
-                _LOGGER.info("Resolume: %s layers discovered (recursive).", len(self._layers))
-
-        except ClientError as err:
-            raise UpdateFailed(f"Connection Error (Discovery): {err}")
+            with self.metrics.phase("discovery"):
+                self._index_layers(await self._async_fetch_composition())
+            _LOGGER.debug("Resolume: %s layers discovered (recursive).", len(self._layers))
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.error("Unexpected error during discovery: %s", err, exc_info=True)
             raise UpdateFailed(f"Unexpected error: {err}")
 
-    async def _async_update_data(self):
-        """Fetch layer state and discover clips."""
-        if not self._layers:
-            await self._async_discover_layers()
-            if not self._layers:
-                _LOGGER.warning("No layers found, aborting update.")
-                return {}
+    async def _async_fetch_clip_name(self, clip_id):
+        """Look up the name of a clip whose layer payload didn't inline it."""
+        _status, clip = await self._async_get_json(
+            "clip", clip_by_id_url(self.host, self.port, clip_id), 2, decode_clip,
+            PRIORITY_BACKGROUND, self._lookup_limit,
+        )
+        return param_name(clip) if clip is not None else None
+
+    def _parse_slots(self, layer):
+        """[(col_index, clip_id, clip_name, unresolved)]; names not inlined come from the resolver cache."""
+        slots = []
+        for idx, clip in enumerate(layer_clips(layer), start=1):
+            if not clip:
+                continue
+
+            clip_id = clip.get("id")
+            clip_name = param_name(clip)
+            unresolved = False
+
+            if clip_name is None and clip_id:
+                clip_name = self._clip_names.get(clip_id)
+                unresolved = clip_name is None
+
+            slots.append((idx, clip_id, clip_name or f"Clip {idx}", unresolved))
+        return slots
+
+    async def _async_fetch_layer(self, layer_id, layer_name):
+        """Fetch one layer's state and clip slots; raises UpdateFailed if Arena doesn't serve it."""
+        status, layer_detail = await self._async_get_json(
+            "layer", layer_by_id_url(self.host, self.port, layer_id), 5, decode_layer, limit=self._request_limit
+        )
+        if layer_detail is None:
+            if status == 404:
+                self._last_discovery = 0.0  # deleted since discovery? re-read /composition next cycle
+            raise UpdateFailed(f"API Error (Layer {layer_id}): {status}")
 
-        data = {}
-        self._clip_slots = []
+        return parse_layer_state(layer_detail), self._parse_slots(layer_detail)
 
+    async def _async_update_data(self):
+        """Fetch layer state and discover clips."""
+        started = time.perf_counter()
+        requests, size = self.metrics.requests, self.metrics.bytes
+        try:
+            if self.update_mode == UPDATE_MODE_COMPOSITION:
+                changed = await self._async_update_from_composition()
+            else:
+                changed = await self._async_update_per_layer()
+        except Exception:
+            # Whatever failed, back off: an unexpected error must not keep the fast rate.
+            self._scheduler.record_failure()
+            self._apply_interval()
+            raise
+        finally:
+            # Listener dispatch happens after we return and is timed as its own phase.
+            self.metrics.record_cycle(
+                (time.perf_counter() - started) * 1000,
+                self.metrics.requests - requests,
+                self.metrics.bytes - size,
+            )
+
+        # After a failure (or on the first run) every entity must refresh its availability.
+        if self.data is None or not self.last_update_success:
+            changed = None
+        self._changed_layers = changed
+        self.dispatch_stats["changed_layers"] = len(self._model.layers) if changed is None else len(changed)
+
+        self._after_slots_updated()
+        self._check_structure()
+        self._scheduler.record_success(changed is None or bool(changed))
+        self._apply_interval()
+        return self._model.layers
+
+    def _apply_layer(self, layer_id, layer_name, state, slots):
+        """Patch one layer into the model; True if its state or slots changed."""
+        state_changed = self._model.update_layer(layer_id, *state)
+        slots_changed = self._model.update_slots(layer_id, layer_name, slots)
+        return state_changed or slots_changed
+
+    async def _async_update_from_composition(self):
+        """One composition GET per cycle: layers, states and slots all come from that document."""
+        with self.metrics.phase("composition_fetch"):
+            composition = await self._async_fetch_composition()
+        started = time.perf_counter()
         try:
-            for layer_id, layer_name in self._layers.items():
-                url = layer_by_id_url(self.host, self.port, layer_id)
-                async with self.session.get(url, timeout=5) as response:
-                    if response.status != 200:
-                        _LOGGER.warning("Failed to get layer %s (maybe a group?), skipping.", layer_id)
-                        continue
-
-                    layer_detail = await response.json()
-
-                    # Active clip
-                    active_clip = layer_detail.get("active_clip")
-                    active_clip_name = "Empty"
-                    active_clip_id = None
-                    if active_clip:
-                        name_param = active_clip.get("name") or (active_clip.get("params", {}) or {}).get("name")
-                        active_clip_name = self._get_value(name_param, "Unnamed Clip")
-                        active_clip_id = active_clip.get("id")
-
-                    # Layer states
-                    bypassed_param = layer_detail.get("bypassed", {})
-                    solo_param = layer_detail.get("solo", {})
-
-                    data[layer_id] = {
-                        "active_clip_name": active_clip_name,
-                        "active_clip_id": active_clip_id,
-                        "is_bypassed": self._get_value(bypassed_param, False),
-                        "is_solo": self._get_value(solo_param, False),
-                    }
-
-                    # Discover clips
-                    clips_list = self._get_value(layer_detail.get("clips", {}), [])
-                    if isinstance(clips_list, list):
-                        for idx, clip in enumerate(clips_list, start=1):
-                            if not clip:
-                                continue
-
-                            clip_id = clip.get("id")
-                            name_param = clip.get("name") or (clip.get("params", {}) or {}).get("name")
-                            clip_name = self._get_value(name_param, None)
-
-                            if clip_name is None and clip_id:
-                                clip_name = self._clip_name_cache.get(clip_id)
-                                if clip_name is None:
-                                    try:
-                                        c_url = clip_by_id_url(self.host, self.port, clip_id)
-                                        async with self.session.get(c_url, timeout=2) as r:
-                                            if r.status == 200:
-                                                cd = await r.json()
-                                                np = cd.get("name") or (cd.get("params", {}) or {}).get("name")
-                                                clip_name = self._get_value(np, None)
-                                                if clip_name:
-                                                    self._clip_name_cache[clip_id] = clip_name
-                                    except Exception:
-                                        pass
-
-                            if not clip_name:
-                                clip_name = f"Clip {idx}"
-
-                            self._clip_slots.append({
-                                "layer_id": layer_id,
-                                "layer_name": layer_name,
-                                "col_index": idx,
-                                "clip_id": clip_id,
-                                "clip_name": clip_name,
-                            })
-
-            return data
-
-        except ClientError as err:
-            raise UpdateFailed(f"Connection Error (Update): {err}")
+            layers = self._index_layers(composition)
+            changed = {
+                layer["id"]
+                for layer, name in layers
+                if self._apply_layer(layer["id"], name, parse_layer_state(layer), self._parse_slots(layer))
+            }
+            changed.update(self._model.retain_layers(self._layers))
         except Exception as err:
             _LOGGER.error("Unexpected error during update: %s", err, exc_info=True)
             raise UpdateFailed(f"Unexpected error: {err}")
+        self.dispatch_stats["diff_ms"] = (time.perf_counter() - started) * 1000
+
+        if not layers:
+            _LOGGER.warning("No layers found in composition.")
+        return changed
+
+    async def _async_update_per_layer(self):
+        """One GET per layer, bounded by the in-flight cap."""
+        # New/removed layers only show up in /composition, so re-read it now and then.
+        if not self._layers or time.monotonic() - self._last_discovery > REDISCOVERY_INTERVAL_SECONDS:
+            await self._async_discover_layers()
+            self._last_discovery = time.monotonic()
+            if not self._layers:
+                _LOGGER.warning("No layers found, aborting update.")
+                self._model.retain_layers([])
+                return set()
+
+        layers = list(self._layers.items())
+        with self.metrics.phase("layer_fetch"):
+            results = await asyncio.gather(
+                *(self._async_fetch_layer(layer_id, layer_name) for layer_id, layer_name in layers),
+                return_exceptions=True,
+            )
+
+        started = time.perf_counter()
+        changed = set()
+        failures = 0
+        # Results come back in discovery order, so the model keeps a stable layout.
+        for (layer_id, layer_name), result in zip(layers, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                failures += 1
+                _LOGGER.warning("Layer %s update failed, keeping it stale: %s", layer_id, result)
+                if self._model.mark_stale(layer_id):
+                    changed.add(layer_id)
+                continue
+            if self._apply_layer(layer_id, layer_name, *result):
+                changed.add(layer_id)
+
+        if failures and failures == len(layers):
+            raise UpdateFailed(f"Connection Error (Update): all {failures} layer requests failed")
+
+        # Layers (and their entities) only go away when /composition no longer lists them,
+        # never because a by-id read failed.
+        changed.update(self._model.retain_layers(self._layers))
+        self.dispatch_stats["diff_ms"] = (time.perf_counter() - started) * 1000
+        return changed
@@ -0,0 +1,33 @@
+"""Diagnostics support for Resolume Arena."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST}
+
+async def async_get_config_entry_diagnostics(hass, entry):
+    """Request, phase and dispatch stats of the entry's coordinator."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "update_mode": coordinator.update_mode,
+            "last_update_success": coordinator.last_update_success,
+            "current_interval": coordinator.current_interval,
+            "push_connected": coordinator.push_connected,
+            "osc": coordinator.osc_status,
+            "connection_pool": coordinator.host_session.as_dict(),
+            # Members carry their host like entry.data does.
+            "poll_group": (
+                async_redact_data(coordinator.poll_group.as_dict(), TO_REDACT) if coordinator.poll_group else None
+            ),
+            "layers": len(coordinator.get_layers()),
+            "clip_slots": len(coordinator.get_clip_slots()),
+        },
+        "dispatch": dict(coordinator.dispatch_stats),
+        "metrics": coordinator.metrics.as_dict(),
+    }
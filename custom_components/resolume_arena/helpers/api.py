@@ -1,5 +1,19 @@
-"""Small helpers to build Resolume API endpoints."""
+"""Resolume API endpoints, and the request layer every call to an Arena host goes through."""
+import asyncio
+import heapq
+from collections import namedtuple
+from itertools import count
+from time import monotonic
+
 from ..const import API_BASE
+from .metrics import Histogram
+
+# Lower runs first when the host's rate limit makes callers queue.
+PRIORITY_TRIGGER = 0
+PRIORITY_POLL = 1
+PRIORITY_BACKGROUND = 2
+
+_PRIORITY_NAMES = {PRIORITY_TRIGGER: "trigger", PRIORITY_POLL: "poll", PRIORITY_BACKGROUND: "background"}
 
 def base_url(host, port):
     return f"http://{host}:{port}{API_BASE}"
@@ -10,5 +24,155 @@ def composition_url(host, port):
 def layer_by_id_url(host, port, layer_id):
     return f"{base_url(host, port)}/composition/layers/by-id/{layer_id}"
 
+def layer_clear_url(host, port, layer_id):
+    return f"{layer_by_id_url(host, port, layer_id)}/clear"
+
+def column_connect_url(host, port, column_index):
+    """Columns are addressed by their 1-based position, like clip slots."""
+    return f"{base_url(host, port)}/composition/columns/{column_index}/connect"
+
 def clip_by_id_url(host, port, clip_id):
     return f"{base_url(host, port)}/composition/clips/by-id/{clip_id}"
+
+def clip_connect_url(host, port, clip_id):
+    return f"{clip_by_id_url(host, port, clip_id)}/connect"
+
+def clip_thumbnail_url(host, port, clip_id):
+    return f"{clip_by_id_url(host, port, clip_id)}/thumbnail"
+
+def websocket_url(host, port):
+    return f"ws://{host}:{port}{API_BASE}"
+
+class ApiResponse(namedtuple("ApiResponse", "status body headers coalesced")):
+    """A fully read response; ``coalesced`` is True for callers that joined another's GET."""
+
+    __slots__ = ()
+
+class TokenBucket:
+    """Token bucket whose queued callers are served by priority, then arrival order.
+
+    A caller takes a token straight away only when nobody is queued, so a burst of polls
+    can't starve a trigger that arrives after them.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = monotonic()
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = count()
+        self._timer = None
+        self.throttled = {name: 0 for name in _PRIORITY_NAMES.values()}
+        self.wait = Histogram()
+
+    def _refill(self):
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    async def acquire(self, priority):
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        self.throttled[_PRIORITY_NAMES[priority]] += 1
+        started = monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        if self._timer is None:
+            self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                self._tokens = min(self.burst, self._tokens + 1)  # granted, then cancelled: give it back
+            raise
+        self.wait.observe((monotonic() - started) * 1000)
+
+    def _wake(self):
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _priority, _seq, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # caller cancelled while queued
+            self._tokens -= 1
+            future.set_result(None)
+        if self._waiters:
+            self._timer = asyncio.get_running_loop().call_later((1 - self._tokens) / self.rate, self._wake)
+
+    def as_dict(self):
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queued": len(self._waiters),
+            "throttled": dict(self.throttled),
+            "wait": self.wait.as_dict(),
+        }
+
+class ArenaApi:
+    """Shared by every entry talking to one Arena host.
+
+    Identical GETs in flight at the same time share one upstream request, and every
+    request waits for a token from the host's bucket (``rate`` 0 disables the limit).
+    A caller's concurrency ``limit`` is only taken once the token is granted, so a
+    request queued on the rate limit doesn't keep others of that caller from being sent.
+    ``concurrency`` caps requests in flight to the host across all its entries, whatever
+    the rate; a request waiting for a slot hasn't started its timeout yet.
+    Bodies are read in full so coalesced callers each get the whole response.
+    """
+
+    def __init__(self, hass, session, rate, concurrency):
+        self._hass = hass
+        self.session = session
+        self._bucket = TokenBucket(rate, max(1, rate)) if rate else None
+        self._host_limit = asyncio.Semaphore(concurrency)
+        self._inflight = {}  # {(url, headers): Task}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def get(self, url, timeout, priority=PRIORITY_POLL, headers=None, limit=None):
+        key = (url, tuple(sorted(headers.items())) if headers else ())
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return (await asyncio.shield(task))._replace(coalesced=True)
+
+        task = self._hass.async_create_task(self._async_get(url, timeout, priority, headers, limit))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_get(self, url, timeout, priority, headers, limit):
+        if self._bucket is not None:
+            await self._bucket.acquire(priority)
+        if limit is None:
+            return await self._async_send_get(url, timeout, headers)
+        async with limit:
+            return await self._async_send_get(url, timeout, headers)
+
+    async def _async_send_get(self, url, timeout, headers):
+        async with self._host_limit:
+            self.requests += 1
+            async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                body = await response.read() if response.status == 200 else b""
+                return ApiResponse(response.status, body, response.headers, False)
+
+    async def post(self, url, timeout, priority=PRIORITY_TRIGGER):
+        """POST a command; returns the HTTP status."""
+        if self._bucket is not None:
+            await self._bucket.acquire(priority)
+        async with self._host_limit:
+            self.requests += 1
+            async with self.session.post(url, timeout=timeout) as response:
+                return response.status
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "rate_limit": self._bucket.as_dict() if self._bucket is not None else None,
+        }
@@ -0,0 +1,117 @@
+"""Background resolution of clip names that layer payloads don't inline."""
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+
+from ..const import (
+    CLIP_NAME_TTL_SECONDS,
+    CLIP_NAME_CACHE_SIZE,
+    CLIP_NAME_RETRY_MIN_SECONDS,
+    CLIP_NAME_RETRY_MAX_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+class ClipNameResolver:
+    """TTL/LRU cache of clip names, filled concurrently outside the update cycle.
+
+    Lookups that fail (or return no name) are remembered and retried with exponential
+    backoff instead of on every poll. An expired name keeps being served while it is
+    looked up again; entries only leave the cache through the LRU bound or ``retain``.
+    """
+
+    def __init__(self, hass, fetch, on_resolved, metrics):
+        self._hass = hass
+        self._fetch = fetch              # async (clip_id) -> name or None
+        self._on_resolved = on_resolved  # callback({clip_id: name})
+        self._metrics = metrics
+        self._cache = OrderedDict()      # {clip_id: (name, expires_at)}
+        self._failures = {}              # {clip_id: (attempts, retry_at)}
+        self._pending = set()
+        self._expired = set()            # served past their TTL, refreshed on the next request()
+        self._task = None
+
+    def get(self, clip_id):
+        """Cached name or None; never does I/O."""
+        entry = self._cache.get(clip_id)
+        if entry is None:
+            return None
+        name, expires_at = entry
+        if expires_at < monotonic():
+            self._expired.add(clip_id)
+        self._cache.move_to_end(clip_id)
+        return name
+
+    def names(self):
+        """{clip_id: name} of every cached entry, for persisting."""
+        return {clip_id: name for clip_id, (name, _expires_at) in self._cache.items()}
+
+    def preload(self, names):
+        """Seed the cache with previously persisted names."""
+        expires_at = monotonic() + CLIP_NAME_TTL_SECONDS
+        for clip_id, name in names.items():
+            self._cache[clip_id] = (name, expires_at)
+        while len(self._cache) > CLIP_NAME_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def request(self, clip_ids):
+        """Queue lookups for clips not cached (or expired) and not backing off, then return immediately."""
+        now = monotonic()
+        expired, self._expired = self._expired, set()
+        for clip_id in [*clip_ids, *expired]:
+            if clip_id in self._pending or (clip_id not in expired and self.get(clip_id) is not None):
+                continue
+            failure = self._failures.get(clip_id)
+            if failure is not None and failure[1] > now:
+                continue
+            self._pending.add(clip_id)
+
+        if self._pending and (self._task is None or self._task.done()):
+            self._task = self._hass.async_create_background_task(self._run(), "resolume_arena clip names")
+
+    def retain(self, clip_ids):
+        """Forget every clip that is no longer part of the composition."""
+        clip_ids = set(clip_ids)
+        for clip_id in [c for c in self._cache if c not in clip_ids]:
+            del self._cache[clip_id]
+        for clip_id in [c for c in self._failures if c not in clip_ids]:
+            del self._failures[clip_id]
+        self._pending &= clip_ids
+        self._expired &= clip_ids
+
+    async def async_stop(self):
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _run(self):
+        while self._pending:
+            batch = list(self._pending)
+            with self._metrics.phase("clip_resolution"):
+                names = await asyncio.gather(*(self._resolve(clip_id) for clip_id in batch))
+            self._pending.difference_update(batch)
+            resolved = {clip_id: name for clip_id, name in zip(batch, names) if name}
+            if resolved:
+                self._on_resolved(resolved)
+
+    async def _resolve(self, clip_id):
+        try:
+            name = await self._fetch(clip_id)
+        except Exception as err:
+            _LOGGER.debug("Clip %s name lookup failed: %s", clip_id, err)
+            name = None
+
+        now = monotonic()
+        if name:
+            self._failures.pop(clip_id, None)
+            self._cache[clip_id] = (name, now + CLIP_NAME_TTL_SECONDS)
+            self._cache.move_to_end(clip_id)
+            while len(self._cache) > CLIP_NAME_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return name
+
+        attempts = self._failures.get(clip_id, (0, 0))[0] + 1
+        delay = min(CLIP_NAME_RETRY_MIN_SECONDS * 2 ** (attempts - 1), CLIP_NAME_RETRY_MAX_SECONDS)
+        self._failures[clip_id] = (attempts, now + delay)
+        return None
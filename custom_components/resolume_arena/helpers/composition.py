@@ -0,0 +1,74 @@
+"""Parsing helpers for Resolume composition and layer payloads."""
+
+def get_value(param_obj, default=None):
+    """Safely read .value out of Resolume params, with sensible fallbacks."""
+    if isinstance(param_obj, dict):
+        val = param_obj.get("value", default)
+        return val if val is not None else default
+    if param_obj is None:
+        return default
+    return param_obj
+
+def param_name(obj):
+    """Inline name of a clip/layer payload, or None."""
+    name_param = obj.get("name") or (obj.get("params", {}) or {}).get("name")
+    return get_value(name_param, None)
+
+def iter_layers(composition):
+    """Yield (layer, full_name) for every layer, recursing into groups."""
+    seen = set()
+
+    def process_item(item, group_name=""):
+        if not isinstance(item, dict):
+            return
+        if "clips" in item:  # it's a Layer
+            layer_id = item.get("id")
+            if layer_id and layer_id not in seen:
+                seen.add(layer_id)
+                layer_name = get_value(item.get("name"), f"Layer {layer_id}")
+                full_name = f"{group_name} - {layer_name}" if group_name else layer_name
+                yield item, full_name
+        elif "layers" in item or "layergroups" in item:  # it's a Group
+            current_group_name = get_value(item.get("name"), "Group")
+            nested_group_name = f"{group_name} - {current_group_name}" if group_name else current_group_name
+            for layer in get_value(item.get("layers"), []):
+                yield from process_item(layer, nested_group_name)
+            for subgroup in get_value(item.get("layergroups"), []):
+                yield from process_item(subgroup, nested_group_name)
+
+    for it in get_value(composition.get("layers"), []):
+        yield from process_item(it)
+    for it in get_value(composition.get("layergroups"), []):
+        yield from process_item(it)
+
+def layer_clips(layer):
+    """The layer's clip list, one entry per column (may contain empty slots)."""
+    clips = get_value(layer.get("clips", {}), [])
+    return clips if isinstance(clips, list) else []
+
+def is_connected(clip):
+    value = get_value(clip.get("connected"), "")
+    return isinstance(value, str) and value.startswith("Connected")
+
+def parse_layer_state(layer):
+    """(active_clip_id, active_clip_name, is_bypassed, is_solo) of a layer payload.
+
+    The by-id layer endpoint reports an ``active_clip``; the composition document doesn't,
+    so fall back to the clip whose ``connected`` param says it is playing.
+    """
+    active_clip = layer.get("active_clip")
+    if active_clip is None:
+        active_clip = next((c for c in layer_clips(layer) if c and is_connected(c)), None)
+
+    active_clip_name = "Empty"
+    active_clip_id = None
+    if active_clip:
+        active_clip_name = param_name(active_clip) or "Unnamed Clip"
+        active_clip_id = active_clip.get("id")
+
+    return (
+        active_clip_id,
+        active_clip_name,
+        bool(get_value(layer.get("bypassed", {}), False)),
+        bool(get_value(layer.get("solo", {}), False)),
+    )
@@ -0,0 +1,76 @@
+"""Decode Arena payloads down to the fields the integration reads.
+
+Clips carry their whole transport/video/audio/effects tree, which the coordinator never
+looks at. Payloads are parsed with orjson (bundled with Home Assistant, stdlib json as a
+fallback) and projected straight away, so only ids, names, bypassed/solo and connected
+states stay alive. Projected documents keep Arena's shape, so the parsing helpers in
+``composition`` work on either.
+"""
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - Home Assistant ships orjson
+    from json import loads
+
+from .composition import get_value
+
+def _param(param):
+    """Keep a parameter's id and value only."""
+    if isinstance(param, dict):
+        return {"id": param.get("id"), "value": param.get("value")}
+    return param
+
+def project_clip(clip):
+    if not isinstance(clip, dict):
+        return clip  # empty slot
+    projected = {"id": clip.get("id"), "name": _param(clip.get("name")), "connected": _param(clip.get("connected"))}
+    params = clip.get("params")
+    if isinstance(params, dict) and "name" in params:
+        projected["params"] = {"name": _param(params["name"])}
+    return projected
+
+def project_layer(layer):
+    projected = {
+        "id": layer.get("id"),
+        "name": _param(layer.get("name")),
+        "bypassed": _param(layer.get("bypassed")),
+        "solo": _param(layer.get("solo")),
+        "clips": [project_clip(clip) for clip in get_value(layer.get("clips"), [])],
+    }
+    if "active_clip" in layer:
+        projected["active_clip"] = project_clip(layer["active_clip"])
+    return projected
+
+def _project_item(item):
+    if not isinstance(item, dict):
+        return item
+    if "clips" in item:
+        return project_layer(item)
+    return {
+        "id": item.get("id"),
+        "name": _param(item.get("name")),
+        "layers": [_project_item(layer) for layer in get_value(item.get("layers"), [])],
+        "layergroups": [_project_item(group) for group in get_value(item.get("layergroups"), [])],
+    }
+
+def project_composition(composition):
+    return {
+        "name": _param(composition.get("name")),
+        "layers": [_project_item(item) for item in get_value(composition.get("layers"), [])],
+        "layergroups": [_project_item(item) for item in get_value(composition.get("layergroups"), [])],
+    }
+
+def decode_composition(body):
+    return project_composition(loads(body))
+
+def decode_layer(body):
+    return project_layer(loads(body))
+
+def decode_clip(body):
+    return project_clip(loads(body))
+
+def decode_push(data):
+    """A websocket frame: parameter updates pass through, composition documents are projected."""
+    message = loads(data)
+    if isinstance(message, dict) and ("layers" in message or "layergroups" in message):
+        return project_composition(message)
+    return message
@@ -1,10 +1,64 @@
 """Common base entity for Resolume integration."""
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 class ResolumeEntity(CoordinatorEntity):
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
+    def __init__(self, coordinator, layer_id=None):
+        # The layer id doubles as listener context: the coordinator only calls back entities
+        # whose layer changed in the last update.
+        super().__init__(coordinator, context=layer_id)
         self._host = coordinator.host
+        self._layer_id = layer_id
         self._attr_device_info = coordinator.device_info
+
+    @property
+    def _layer_state(self):
+        """LayerState this entity reads from, or None."""
+        if self._layer_id is None or not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._layer_id)
+
+    @property
+    def available(self):
+        """Unavailable while the layer this entity reads from could not be refreshed."""
+        if not super().available:
+            return False
+        state = self._layer_state
+        return not (state and state.stale)
+
+@callback
+def async_setup_dynamic_entities(hass, entry, coordinator, async_add_entities, get_items, create_entities):
+    """Keep a platform's entities in step with the composition without reloading.
+
+    ``get_items`` returns ``{key: item}`` for what currently exists in Arena and
+    ``create_entities(key, item)`` builds the entities for one new key. Entities whose key
+    disappears are removed; entities whose key survives are left untouched.
+    """
+    known = {}  # {key: [entities]}
+
+    @callback
+    def _async_sync():
+        items = get_items()
+        new_entities = []
+        for key, item in items.items():
+            if key not in known:
+                known[key] = create_entities(key, item)
+                new_entities.extend(known[key])
+
+        registry = er.async_get(hass)
+        for key in [k for k in known if k not in items]:
+            for entity in known.pop(key):
+                if entity.entity_id and registry.async_get(entity.entity_id):
+                    # Removing the registry entry also tears down the live entity.
+                    registry.async_remove(entity.entity_id)
+                else:
+                    hass.async_create_task(entity.async_remove(force_remove=True))
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_sync()
+    entry.async_on_unload(coordinator.async_add_structure_listener(_async_sync))
@@ -0,0 +1,191 @@
+"""Cheap counters and latency histograms for the coordinator's hot path.
+
+Recording is a perf_counter() pair, a bisect over a short tuple and a few integer
+increments, so it stays on in production.
+"""
+import asyncio
+from bisect import bisect_left
+from time import perf_counter
+
+# Upper bounds (ms) of the latency buckets; one extra bucket catches everything slower.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max", "last")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = None
+
+    def observe(self, value_ms):
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.last = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def as_dict(self):
+        buckets = {f"le_{bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else None,
+            "max_ms": round(self.max, 2),
+            "last_ms": round(self.last, 2) if self.last is not None else None,
+            "buckets": buckets,
+        }
+
+class EndpointStats:
+    __slots__ = ("latency", "requests", "coalesced", "errors", "timeouts", "bytes", "max_bytes")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.requests = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes = 0
+        self.max_bytes = 0
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes": self.bytes,
+            "mean_bytes": round(self.bytes / self.requests) if self.requests else None,
+            "max_bytes": self.max_bytes,
+            "latency": self.latency.as_dict(),
+        }
+
+class RequestSample:
+    """Times one HTTP request; set ``size`` once the body is read and ``ok = False`` on a bad status.
+
+    A ``coalesced`` request rode on another caller's: it is timed but its bytes aren't counted.
+    """
+
+    __slots__ = ("_metrics", "_stats", "_started", "size", "ok", "coalesced")
+
+    def __init__(self, metrics, stats):
+        self._metrics = metrics
+        self._stats = stats
+        self.size = 0
+        self.ok = True
+        self.coalesced = False
+
+    def __enter__(self):
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stats = self._stats
+        stats.latency.observe((perf_counter() - self._started) * 1000)
+        if self.coalesced:
+            stats.coalesced += 1
+            self._metrics.coalesced += 1
+            return False
+        stats.requests += 1
+        self._metrics.requests += 1
+        if exc_type is not None and issubclass(exc_type, asyncio.TimeoutError):
+            stats.timeouts += 1
+        elif (exc_type is not None and issubclass(exc_type, Exception)) or not self.ok:
+            stats.errors += 1
+        if self.size:
+            stats.bytes += self.size
+            self._metrics.bytes += self.size
+            if self.size > stats.max_bytes:
+                stats.max_bytes = self.size
+        return False
+
+class PhaseTimer:
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe((perf_counter() - self._started) * 1000)
+        return False
+
+class CoordinatorMetrics:
+    """Per-endpoint request stats, per-phase timings and the shape of the last poll cycle."""
+
+    def __init__(self):
+        self.endpoints = {}   # {endpoint: EndpointStats}
+        self.phases = {}      # {phase: Histogram}
+        self.requests = 0     # all requests, cycles and background lookups alike
+        self.bytes = 0
+        self.coalesced = 0    # GETs answered by an identical one already in flight
+        self.push_messages = 0
+        self.osc_messages = 0
+        self.optimistic_updates = 0
+        self.rollbacks = 0
+        self.cycles = Histogram()
+        self.last_cycle_requests = 0
+        self.last_cycle_bytes = 0
+
+    def request(self, endpoint):
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return RequestSample(self, stats)
+
+    def phase(self, name):
+        return PhaseTimer(self._phase(name))
+
+    def observe(self, name, value_ms):
+        """Record a duration measured across callbacks rather than around a block."""
+        self._phase(name).observe(value_ms)
+
+    def _phase(self, name):
+        histogram = self.phases.get(name)
+        if histogram is None:
+            histogram = self.phases[name] = Histogram()
+        return histogram
+
+    def mean_latency_ms(self):
+        """Mean latency of every HTTP request to the host so far, or None."""
+        count = total = 0
+        for name, stats in self.endpoints.items():
+            if not name.startswith("osc_"):
+                count += stats.latency.count
+                total += stats.latency.total
+        return round(total / count, 2) if count else None
+
+    @property
+    def last_cycle_ms(self):
+        return self.cycles.last
+
+    def record_cycle(self, duration_ms, requests, size):
+        self.cycles.observe(duration_ms)
+        self.last_cycle_requests = requests
+        self.last_cycle_bytes = size
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "coalesced": self.coalesced,
+            "mean_latency_ms": self.mean_latency_ms(),
+            "push_messages": self.push_messages,
+            "osc_messages": self.osc_messages,
+            "optimistic_updates": self.optimistic_updates,
+            "rollbacks": self.rollbacks,
+            "cycles": self.cycles.as_dict(),
+            "last_cycle": {
+                "duration_ms": round(self.last_cycle_ms, 2) if self.last_cycle_ms is not None else None,
+                "requests": self.last_cycle_requests,
+                "bytes": self.last_cycle_bytes,
+            },
+            "endpoints": {name: stats.as_dict() for name, stats in self.endpoints.items()},
+            "phases": {name: histogram.as_dict() for name, histogram in self.phases.items()},
+        }
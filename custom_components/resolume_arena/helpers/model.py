@@ -0,0 +1,124 @@
+"""Typed snapshot of a Resolume composition, updated in place between cycles."""
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class LayerState:
+    layer_id: int
+    active_clip_id: int | None = None
+    active_clip_name: str = "Empty"
+    is_bypassed: bool = False
+    is_solo: bool = False
+    stale: bool = False
+
+@dataclass(slots=True)
+class ClipSlot:
+    layer_id: int
+    layer_name: str
+    col_index: int
+    clip_id: int | None
+    clip_name: str
+    unresolved: bool = False
+
+class CompositionModel:
+    """Layer states by layer id and clip slots by (layer id, column).
+
+    Records survive across cycles: an unchanged layer or slot keeps the same object and
+    costs no allocation, a changed one is patched in place. ``structure_version`` moves
+    whenever layers or slots are added, removed, reordered or point at another clip.
+    """
+
+    __slots__ = ("layers", "slots", "structure_version", "replaced_clips", "_slots_by_layer")
+
+    def __init__(self):
+        self.layers = {}            # {layer_id: LayerState}
+        self.slots = {}             # {(layer_id, col_index): ClipSlot}
+        self.structure_version = 0
+        self.replaced_clips = []    # [(old_clip_id, new_clip_id)] since last drained
+        self._slots_by_layer = {}   # {layer_id: [ClipSlot]} in column order
+
+    def slots_of(self, layer_id):
+        return self._slots_by_layer.get(layer_id, ())
+
+    def update_layer(self, layer_id, active_clip_id, active_clip_name, is_bypassed, is_solo):
+        """Apply a parsed layer state; True if anything changed."""
+        state = self.layers.get(layer_id)
+        if state is None:
+            self.layers[layer_id] = LayerState(layer_id, active_clip_id, active_clip_name, is_bypassed, is_solo)
+            self.structure_version += 1
+            return True
+        if (
+            state.active_clip_id == active_clip_id
+            and state.active_clip_name == active_clip_name
+            and state.is_bypassed == is_bypassed
+            and state.is_solo == is_solo
+            and not state.stale
+        ):
+            return False
+        state.active_clip_id = active_clip_id
+        state.active_clip_name = active_clip_name
+        state.is_bypassed = is_bypassed
+        state.is_solo = is_solo
+        state.stale = False
+        return True
+
+    def mark_stale(self, layer_id):
+        """Keep the last known state but flag it; True if the flag flipped."""
+        state = self.layers.get(layer_id)
+        if state is None:
+            self.layers[layer_id] = LayerState(layer_id, stale=True)
+            self.structure_version += 1
+            return True
+        if state.stale:
+            return False
+        state.stale = True
+        return True
+
+    def update_slots(self, layer_id, layer_name, clips):
+        """Apply [(col_index, clip_id, clip_name, unresolved)] for a layer; True if any slot changed."""
+        changed = False
+        existing = self._slots_by_layer.get(layer_id)
+        rebuild = existing is None or len(existing) != len(clips)
+
+        for position, (col_index, clip_id, clip_name, unresolved) in enumerate(clips):
+            slot = self.slots.get((layer_id, col_index))
+            if slot is None:
+                slot = ClipSlot(layer_id, layer_name, col_index, clip_id, clip_name, unresolved)
+                self.slots[(layer_id, col_index)] = slot
+                changed = rebuild = True
+            else:
+                if slot.clip_id != clip_id:
+                    self.replaced_clips.append((slot.clip_id, clip_id))
+                    slot.clip_id = clip_id
+                    self.structure_version += 1
+                    changed = True
+                if slot.clip_name != clip_name or slot.layer_name != layer_name:
+                    slot.clip_name = clip_name
+                    slot.layer_name = layer_name
+                    changed = True
+                slot.unresolved = unresolved
+            if not rebuild and existing[position] is not slot:
+                rebuild = True
+
+        if rebuild:
+            columns = {clip[0] for clip in clips}
+            for slot in existing or ():
+                if slot.col_index not in columns:
+                    del self.slots[(layer_id, slot.col_index)]
+            self._slots_by_layer[layer_id] = [self.slots[(layer_id, clip[0])] for clip in clips]
+            self.structure_version += 1
+            changed = True
+        return changed
+
+    def retain_layers(self, layer_ids):
+        """Drop layers (and their slots) not in ``layer_ids`` and follow its order; returns removed ids."""
+        if len(self.layers) == len(layer_ids) and all(a == b for a, b in zip(self.layers, layer_ids)):
+            return set()
+        keep = set(layer_ids)
+        removed = {layer_id for layer_id in self.layers if layer_id not in keep}
+        for layer_id in removed:
+            del self.layers[layer_id]
+            for slot in self._slots_by_layer.pop(layer_id, ()):
+                self.slots.pop((layer_id, slot.col_index), None)
+        self.layers = {layer_id: self.layers[layer_id] for layer_id in layer_ids if layer_id in self.layers}
+        self.structure_version += 1
+        return removed
@@ -0,0 +1,142 @@
+"""Minimal OSC-over-UDP transport for Resolume Arena.
+
+Only what the integration needs: int/float/string/bool arguments, messages and bundles.
+Arena takes commands on its OSC input port and, if OSC output is enabled in its
+preferences, reports parameter changes to the address:port configured there.
+"""
+import asyncio
+import logging
+import socket
+import struct
+
+_LOGGER = logging.getLogger(__name__)
+
+def _pad(data):
+    return data + b"\0" * (4 - len(data) % 4)
+
+def encode_message(address, *args):
+    """Serialize one OSC message."""
+    tags = ","
+    payload = b""
+    for arg in args:
+        if arg is True or arg is False:
+            tags += "T" if arg else "F"
+        elif isinstance(arg, int):
+            tags += "i"
+            payload += struct.pack(">i", arg)
+        elif isinstance(arg, float):
+            tags += "f"
+            payload += struct.pack(">f", arg)
+        else:
+            tags += "s"
+            payload += _pad(str(arg).encode())
+    return _pad(address.encode()) + _pad(tags.encode()) + payload
+
+def _read_string(data, offset):
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode(errors="replace"), (end // 4 + 1) * 4
+
+def decode_packet(data):
+    """Yield (address, [args]) for an OSC message or every message of a bundle."""
+    if data.startswith(b"#bundle\0"):
+        offset = 16  # "#bundle\0" + 8-byte time tag
+        while offset + 4 <= len(data):
+            (size,) = struct.unpack_from(">i", data, offset)
+            yield from decode_packet(data[offset + 4:offset + 4 + size])
+            offset += 4 + size
+        return
+
+    address, offset = _read_string(data, 0)
+    tags, offset = _read_string(data, offset) if offset < len(data) else (",", offset)
+    args = []
+    for tag in tags[1:]:
+        if tag == "i":
+            args.append(struct.unpack_from(">i", data, offset)[0])
+            offset += 4
+        elif tag == "f":
+            args.append(struct.unpack_from(">f", data, offset)[0])
+            offset += 4
+        elif tag == "h":
+            args.append(struct.unpack_from(">q", data, offset)[0])
+            offset += 8
+        elif tag == "d":
+            args.append(struct.unpack_from(">d", data, offset)[0])
+            offset += 8
+        elif tag == "s":
+            value, offset = _read_string(data, offset)
+            args.append(value)
+        elif tag in "TF":
+            args.append(tag == "T")
+        else:
+            break  # blobs and exotic types carry nothing we use
+    yield address, args
+
+class _OscProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_message):
+        self._on_message = on_message
+
+    def datagram_received(self, data, addr):
+        if self._on_message is None:
+            return
+        try:
+            messages = list(decode_packet(data))
+        except (ValueError, struct.error, IndexError) as err:
+            _LOGGER.debug("Ignoring malformed OSC packet from %s: %s", addr, err)
+            return
+        for address, args in messages:
+            try:
+                self._on_message(address, args)
+            except Exception:  # a stray packet must never raise into the event loop
+                _LOGGER.exception("Error handling OSC message %s from %s", address, addr)
+
+class ResolumeOscClient:
+    """Sends OSC commands to Arena and hands its OSC output to ``on_message(address, args)``.
+
+    ``feedback_port`` 0 only sends. If the port can't be bound the client still sends,
+    so triggers keep their fast path.
+    """
+
+    def __init__(self, host, port, feedback_port, on_message):
+        self._host = host
+        self._port = port
+        self._feedback_port = feedback_port
+        self._on_message = on_message
+        self._target = None
+        self._transport = None
+        self.listening = False
+
+    @property
+    def ready(self):
+        return self._transport is not None
+
+    async def async_start(self):
+        loop = asyncio.get_running_loop()
+        try:
+            # Resolve once: sendto() with a host name would resolve on the event loop every time.
+            infos = await loop.getaddrinfo(self._host, self._port, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        except OSError as err:
+            _LOGGER.error("Cannot resolve %s for OSC, triggers stay on HTTP: %s", self._host, err)
+            return
+        self._target = infos[0][4]
+
+        if self._feedback_port:
+            try:
+                self._transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _OscProtocol(self._on_message), local_addr=("0.0.0.0", self._feedback_port)
+                )
+                self.listening = True
+                return
+            except OSError as err:
+                _LOGGER.error("Cannot listen for Arena OSC output on UDP %s: %s", self._feedback_port, err)
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _OscProtocol(None), family=socket.AF_INET
+        )
+
+    def send(self, address, *args):
+        self._transport.sendto(encode_message(address, *args), self._target)
+
+    async def async_stop(self):
+        transport, self._transport = self._transport, None
+        self.listening = False
+        if transport is not None:
+            transport.close()
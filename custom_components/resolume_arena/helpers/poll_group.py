@@ -0,0 +1,87 @@
+"""Drive the polls of several Arena coordinators from one staggered schedule."""
+import asyncio
+import logging
+from time import monotonic
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLL_GROUPS = f"{DOMAIN}_poll_groups"
+
+class PollGroup:
+    """Refreshes member coordinators concurrently, spread evenly over each tick.
+
+    Members keep their own adaptive interval; the group ticks at the shortest one and
+    refreshes whoever is due, member ``i`` of ``n`` starting ``i / n`` of a tick later
+    so hosts polled together never all hit the network at the same instant.
+    """
+
+    def __init__(self, hass, name):
+        self.hass = hass
+        self.name = name
+        self.members = []
+        self._next_due = {}  # {coordinator: monotonic deadline}
+        self._task = None
+
+    def add(self, coordinator):
+        self.members.append(coordinator)
+        self._next_due[coordinator] = 0.0
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(self._run(), f"resolume_arena poll group {self.name}")
+
+    def remove(self, coordinator):
+        """Drop a member; returns True when the group is now empty."""
+        self.members.remove(coordinator)
+        self._next_due.pop(coordinator, None)
+        if not self.members and self._task is not None:
+            self._task.cancel()
+            self._task = None
+        return not self.members
+
+    async def _run(self):
+        while self.members:
+            members = list(self.members)
+            tick = min(member.current_interval for member in members)
+            started = monotonic()
+            due = [member for member in members if self._next_due.get(member, 0.0) <= started]
+            await asyncio.gather(
+                *(self._refresh(member, index * tick / len(members)) for index, member in enumerate(due))
+            )
+            await asyncio.sleep(max(0.0, started + tick - monotonic()))
+
+    async def _refresh(self, member, offset):
+        await asyncio.sleep(offset)
+        try:
+            await member.async_refresh()
+        except Exception as err:  # a member must never stop the others
+            _LOGGER.error("Poll group %s: refresh of %s failed: %s", self.name, member.host, err)
+        if member in self._next_due:
+            self._next_due[member] = monotonic() + member.current_interval
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "members": [
+                {
+                    "host": member.host,
+                    "interval": member.current_interval,
+                    "last_update_success": member.last_update_success,
+                    "last_cycle_ms": member.metrics.last_cycle_ms,
+                    "latency_ms": member.metrics.mean_latency_ms(),
+                }
+                for member in self.members
+            ],
+        }
+
+def async_join_poll_group(hass, name, coordinator):
+    groups = hass.data.setdefault(DATA_POLL_GROUPS, {})
+    group = groups.get(name)
+    if group is None:
+        group = groups[name] = PollGroup(hass, name)
+    group.add(coordinator)
+    return group
+
+def async_leave_poll_group(hass, group, coordinator):
+    if group.remove(coordinator):
+        hass.data.get(DATA_POLL_GROUPS, {}).pop(group.name, None)
@@ -0,0 +1,54 @@
+"""Adaptive poll interval for the Resolume coordinator."""
+import random
+from time import monotonic
+
+# Each identical snapshot outside the boost window stretches the interval by this factor.
+IDLE_GROWTH = 1.25
+
+class AdaptiveScheduler:
+    """Picks the next poll interval (seconds) from recent activity and failures.
+
+    * fast interval for ``boost_window`` seconds after a user action or a detected change;
+    * otherwise start at the base interval and slow down while snapshots stay identical,
+      up to ``idle_interval``;
+    * exponential backoff with jitter on failures, up to ``backoff_max``.
+    """
+
+    def __init__(self, base, fast, idle_interval, backoff_max, boost_window):
+        self.base = base
+        self.fast = min(fast, base)
+        self.idle_interval = max(idle_interval, base)
+        self.backoff_max = max(backoff_max, base)
+        self.boost_window = boost_window
+        self.interval = base
+        self._boost_until = 0.0
+        self._idle_cycles = 0
+        self._failures = 0
+
+    def note_activity(self):
+        """Something happened (button press, state change): poll fast for a while."""
+        self._boost_until = monotonic() + self.boost_window
+        self._idle_cycles = 0
+        if not self._failures:
+            self.interval = self.fast
+
+    def record_success(self, changed):
+        self._failures = 0
+        if changed:
+            self.note_activity()
+        elif self.base * IDLE_GROWTH ** self._idle_cycles < self.idle_interval:
+            self._idle_cycles += 1  # stop at the ceiling: after a day of idling the power would overflow
+
+        if monotonic() < self._boost_until:
+            self.interval = self.fast
+        else:
+            self.interval = min(self.base * IDLE_GROWTH ** self._idle_cycles, self.idle_interval)
+        return self.interval
+
+    def record_failure(self):
+        if self.base * 2 ** self._failures < self.backoff_max:
+            self._failures += 1  # same for the backoff exponent during a long outage
+        delay = min(self.base * 2 ** self._failures, self.backoff_max)
+        # Jitter keeps several HA instances from hammering a rebooting Arena in lockstep.
+        self.interval = delay * random.uniform(0.8, 1.2)
+        return self.interval
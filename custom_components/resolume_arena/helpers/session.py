@@ -0,0 +1,90 @@
+"""One pooled aiohttp session per Arena host, shared by everything talking to it."""
+import logging
+
+from aiohttp import ClientSession, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+
+from ..const import (
+    DOMAIN,
+    CONF_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT,
+    CONF_KEEPALIVE_TIMEOUT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DNS_CACHE_SECONDS,
+    CONF_REQUEST_RATE,
+    DEFAULT_REQUEST_RATE,
+)
+from .api import ArenaApi
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+
+class HostSession:
+    """A session whose connector is sized for one Arena webserver, and its request layer."""
+
+    __slots__ = ("session", "api", "limit", "keepalive_timeout", "users")
+
+    def __init__(self, hass, limit, keepalive_timeout, rate):
+        # Arena's webserver is small: cap sockets per host, keep them warm between polls
+        # and don't resolve the host name on every new connection.
+        connector = TCPConnector(
+            limit=limit,
+            limit_per_host=limit,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=DNS_CACHE_SECONDS,
+            use_dns_cache=True,
+        )
+        self.session = ClientSession(connector=connector)
+        # The connector already caps sockets; the request layer caps requests to match, so
+        # queued ones wait outside aiohttp's timeout and it holds even with no rate limit.
+        self.api = ArenaApi(hass, self.session, rate, limit)
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self.users = 0
+
+    def as_dict(self):
+        return {
+            "limit": self.limit,
+            "keepalive_timeout": self.keepalive_timeout,
+            "users": self.users,
+            "requests": self.api.as_dict(),
+        }
+
+@callback
+def async_get_host_session(hass, host, port, options):
+    """Shared session for host:port; pair every call with async_release_host_session."""
+    sessions = hass.data.get(DATA_SESSIONS)
+    if sessions is None:
+        sessions = hass.data[DATA_SESSIONS] = {}
+
+        async def _close_all(_event):
+            for pooled in sessions.values():
+                await pooled.session.close()
+            sessions.clear()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close_all)
+
+    pooled = sessions.get((host, port))
+    if pooled is None:
+        pooled = sessions[(host, port)] = HostSession(
+            hass,
+            options.get(CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT),
+            options.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT),
+            options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+        )
+    pooled.users += 1
+    return pooled
+
+async def async_release_host_session(hass, host, port):
+    """Drop one user of host:port's session, closing it with the last one."""
+    sessions = hass.data.get(DATA_SESSIONS, {})
+    pooled = sessions.get((host, port))
+    if pooled is None:
+        return
+    pooled.users -= 1
+    if pooled.users <= 0:
+        del sessions[(host, port)]
+        await pooled.session.close()
@@ -0,0 +1,127 @@
+"""In-memory LRU cache of clip thumbnails fetched from Arena."""
+import asyncio
+import io
+import logging
+from collections import OrderedDict
+from time import monotonic
+
+from aiohttp import hdrs
+
+from ..const import THUMBNAIL_CACHE_SIZE, THUMBNAIL_CACHE_BYTES, THUMBNAIL_REVALIDATE_SECONDS
+from .api import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+class Thumbnail:
+    __slots__ = ("body", "content_type", "etag", "last_modified", "checked_at")
+
+    def __init__(self, body, content_type, etag, last_modified):
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.checked_at = monotonic()
+
+def _downscale(body, size):
+    """Shrink an image so its longest side is ``size`` px; returns the input if Pillow is missing."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return body, None
+    with Image.open(io.BytesIO(body)) as image:
+        if max(image.size) <= size:
+            return body, None
+        image.thumbnail((size, size))
+        out = io.BytesIO()
+        image.save(out, format="PNG")
+    return out.getvalue(), "image/png"
+
+class ThumbnailCache:
+    """Bounded LRU keyed by (clip_id, size).
+
+    Entries younger than the revalidation delay are served as-is; older ones are revalidated
+    with If-None-Match/If-Modified-Since so an unchanged thumbnail costs Arena a 304.
+    Concurrent misses for the same key share one upstream request.
+    """
+
+    def __init__(self, hass, api, metrics):
+        self._hass = hass
+        self._api = api
+        self._metrics = metrics
+        self._entries = OrderedDict()  # {(clip_id, size): Thumbnail}
+        self._inflight = {}            # {(clip_id, size): Task}
+        self._bytes = 0
+
+    async def async_get(self, url, clip_id, size=None):
+        """Thumbnail for a clip, or None if Arena has none and nothing is cached."""
+        key = (clip_id, size)
+        entry = self._entries.get(key)
+        if entry is not None and monotonic() - entry.checked_at < THUMBNAIL_REVALIDATE_SECONDS:
+            self._entries.move_to_end(key)
+            return entry
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._hass.async_create_task(self._async_fetch(url, key, entry))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def invalidate(self, clip_id):
+        for key in [k for k in self._entries if k[0] == clip_id]:
+            self._drop(key)
+
+    def retain(self, clip_ids):
+        for key in [k for k in self._entries if k[0] not in clip_ids]:
+            self._drop(key)
+
+    async def _async_fetch(self, url, key, entry):
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers[hdrs.IF_NONE_MATCH] = entry.etag
+            if entry.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+
+        try:
+            with self._metrics.request("thumbnail") as sample:
+                response = await self._api.get(url, 5, PRIORITY_BACKGROUND, headers)
+                sample.coalesced = response.coalesced
+                if response.status == 304 and entry is not None:
+                    entry.checked_at = monotonic()
+                    self._entries.move_to_end(key)
+                    return entry
+                if response.status != 200:
+                    sample.ok = False
+                    _LOGGER.debug("Thumbnail %s: HTTP %s", url, response.status)
+                    return entry
+                body = response.body
+                sample.size = len(body)
+                content_type = response.headers.get(hdrs.CONTENT_TYPE, "image/png").split(";")[0]
+                etag = response.headers.get(hdrs.ETAG)
+                last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        except Exception as err:
+            _LOGGER.debug("Thumbnail %s fetch failed: %s", url, err)
+            return entry  # serve the stale copy rather than a broken image
+
+        size = key[1]
+        if size:
+            try:
+                body, scaled_type = await self._hass.async_add_executor_job(_downscale, body, size)
+                content_type = scaled_type or content_type
+            except Exception as err:
+                _LOGGER.debug("Could not downscale thumbnail %s: %s", url, err)
+
+        if entry is not None:
+            self._drop(key)
+        entry = Thumbnail(body, content_type, etag, last_modified)
+        self._entries[key] = entry
+        self._bytes += len(body)
+        while self._entries and (len(self._entries) > THUMBNAIL_CACHE_SIZE or self._bytes > THUMBNAIL_CACHE_BYTES):
+            self._drop(next(iter(self._entries)))
+        return entry
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
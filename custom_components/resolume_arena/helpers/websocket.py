@@ -0,0 +1,97 @@
+"""Websocket push client for Resolume Arena."""
+import asyncio
+import logging
+import random
+from contextlib import suppress
+
+from aiohttp import ClientError, WSMsgType
+
+from ..const import WS_RECONNECT_MIN_SECONDS, WS_RECONNECT_MAX_SECONDS, DECODE_EXECUTOR_THRESHOLD_BYTES
+from .decode import decode_push
+
+_LOGGER = logging.getLogger(__name__)
+
+class ResolumePushClient:
+    """Keeps a websocket open to Arena and forwards every JSON message it sends."""
+
+    def __init__(self, session, url, on_message, on_connection_change):
+        self._session = session
+        self._url = url
+        self._on_message = on_message
+        self._on_connection_change = on_connection_change
+        self._ws = None
+        self._hass = None
+        self._task = None
+        self._subscribed = set()
+        self._stopping = False
+        self.connected = False
+
+    def start(self, hass):
+        """Spawn the reconnect loop in the background."""
+        if self._task is None:
+            self._hass = hass
+            self._stopping = False
+            self._task = hass.async_create_background_task(self._run(), f"resolume_arena websocket {self._url}")
+
+    async def stop(self):
+        """Close the socket and stop reconnecting."""
+        self._stopping = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def subscribe(self, parameter_ids):
+        """Ask Arena to push updates for the given parameter ids."""
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+        for param_id in parameter_ids:
+            if param_id in self._subscribed:
+                continue
+            await ws.send_json({"action": "subscribe", "parameter": f"/parameter/by-id/{param_id}"})
+            self._subscribed.add(param_id)
+
+    def _set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if not self._stopping:
+            self._on_connection_change(connected)
+
+    async def _run(self):
+        delay = WS_RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                async with self._session.ws_connect(self._url, heartbeat=30) as ws:
+                    self._ws = ws
+                    self._subscribed.clear()
+                    delay = WS_RECONNECT_MIN_SECONDS
+                    self._set_connected(True)
+                    _LOGGER.info("Resolume websocket connected (%s).", self._url)
+                    async for msg in ws:
+                        if msg.type == WSMsgType.TEXT:
+                            try:
+                                if len(msg.data) > DECODE_EXECUTOR_THRESHOLD_BYTES:
+                                    payload = await self._hass.async_add_executor_job(decode_push, msg.data)
+                                else:
+                                    payload = decode_push(msg.data)
+                            except ValueError:
+                                _LOGGER.debug("Ignoring non-JSON websocket frame.")
+                                continue
+                            if isinstance(payload, dict):
+                                self._on_message(payload)
+                        elif msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
+                            break
+            except (ClientError, asyncio.TimeoutError, OSError) as err:
+                _LOGGER.debug("Resolume websocket error (%s): %s", self._url, err)
+            except Exception as err:
+                _LOGGER.error("Unexpected websocket error: %s", err, exc_info=True)
+            finally:
+                self._ws = None
+                self._set_connected(False)
+
+            # Exponential backoff with jitter so several HA instances don't reconnect in lockstep.
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, WS_RECONNECT_MAX_SECONDS)
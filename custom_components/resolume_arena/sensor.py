@@ -1,51 +1,108 @@
 """Sensors for Resolume Arena."""
 import logging
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
 from .const import DOMAIN
-from .helpers.entity import ResolumeEntity
+from .helpers.entity import ResolumeEntity, async_setup_dynamic_entities
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    """Create one 'Active Clip' sensor per layer."""
+    """Create one 'Active Clip' sensor per layer, following layers as they come and go."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    layers = coordinator.get_layers()
-    if not layers:
+    if not coordinator.get_layers():
         _LOGGER.warning("No layers found in Resolume composition.")
-        return
-    sensors = [
-        ResolumeActiveClipSensor(coordinator, layer_id, layer_name)
-        for layer_id, layer_name in layers.items()
-    ]
-    async_add_entities(sensors)
+    async_setup_dynamic_entities(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        coordinator.get_layers,
+        lambda layer_id, layer_name: [ResolumeActiveClipSensor(coordinator, layer_id, layer_name)],
+    )
+    async_add_entities([
+        ResolumePollIntervalSensor(coordinator),
+        ResolumeLastPollDurationSensor(coordinator),
+        ResolumeRequestsPerCycleSensor(coordinator),
+    ])
 
 class ResolumeActiveClipSensor(ResolumeEntity, SensorEntity):
     """Shows the active clip name for a layer."""
     _attr_icon = "mdi:play-box"
     _attr_native_unit_of_measurement = None
+    _unrecorded_attributes = frozenset({"layer_id"})
 
     def __init__(self, coordinator, layer_id, layer_name):
-        super().__init__(coordinator)
-        self._layer_id = layer_id
-        self._layer_name = layer_name
+        super().__init__(coordinator, layer_id)
         self._host = coordinator.host
         self._attr_name = f"{layer_name} Active Clip"
         self._attr_unique_id = f"resolume_{self._host}_layer_{layer_id}_active_clip"
 
     @property
     def native_value(self):
-        if not self.coordinator.data:
-            return "Unknown"
-        layer_data = self.coordinator.data.get(self._layer_id)
-        if not layer_data:
+        state = self._layer_state
+        if not state:
             return "Unknown"
-        return layer_data.get("active_clip_name", "Empty")
+        return state.active_clip_name
 
     @property
     def extra_state_attributes(self):
-        layer_data = (self.coordinator.data.get(self._layer_id) or {}) if self.coordinator.data else {}
+        state = self._layer_state
         return {
-            "layer_name": self._layer_name,
             "layer_id": self._layer_id,
-            "active_clip_id": layer_data.get("active_clip_id"),
+            "active_clip_id": state.active_clip_id if state else None,
         }
+
+class ResolumePollIntervalSensor(ResolumeEntity, SensorEntity):
+    """Effective interval chosen by the adaptive poll scheduler."""
+    _attr_icon = "mdi:timer-sync-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Moves on almost every idle poll; only worth recording when someone is looking into it.
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Poll interval"
+        self._attr_unique_id = f"resolume_{self._host}_poll_interval"
+
+    @property
+    def native_value(self):
+        interval = self.coordinator.current_interval
+        return round(interval, 1) if interval is not None else None
+
+class ResolumeLastPollDurationSensor(ResolumeEntity, SensorEntity):
+    """Wall time of the last poll cycle, listener dispatch excluded."""
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Last poll duration"
+        self._attr_unique_id = f"resolume_{self._host}_last_poll_duration"
+
+    @property
+    def native_value(self):
+        duration = self.coordinator.metrics.last_cycle_ms
+        return round(duration, 1) if duration is not None else None
+
+class ResolumeRequestsPerCycleSensor(ResolumeEntity, SensorEntity):
+    """HTTP requests the last poll cycle sent to Arena."""
+    _attr_icon = "mdi:swap-vertical"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_name = "Requests per poll"
+        self._attr_unique_id = f"resolume_{self._host}_requests_per_cycle"
+
+    @property
+    def native_value(self):
+        return self.coordinator.metrics.last_cycle_requests
@@ -0,0 +1,82 @@
+"""Services firing several clips, a column or layer clears in one go."""
+import voluptuous as vol
+
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+
+SERVICE_TRIGGER_COLUMN = "trigger_column"
+SERVICE_TRIGGER_CLIPS = "trigger_clips"
+SERVICE_CLEAR_LAYERS = "clear_layers"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_COLUMN = "column"
+ATTR_CLIPS = "clips"
+ATTR_LAYERS = "layers"
+ATTR_LAYER_ID = "layer_id"
+
+_COLUMN = vol.All(vol.Coerce(int), vol.Range(min=1))
+# A clip is either its Arena id or the slot holding it.
+_CLIP_TARGET = vol.Any(
+    vol.Coerce(int),
+    vol.Schema({vol.Required(ATTR_LAYER_ID): vol.Coerce(int), vol.Required(ATTR_COLUMN): _COLUMN}),
+)
+
+TRIGGER_COLUMN_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_COLUMN): _COLUMN,
+})
+TRIGGER_CLIPS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_CLIPS): vol.All(cv.ensure_list, [_CLIP_TARGET]),
+})
+CLEAR_LAYERS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_LAYERS): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+})
+
+def _get_coordinator(hass, call):
+    """Coordinator of the entry the call targets; the entry may be omitted when there is only one."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None and len(coordinators) == 1:
+        return next(iter(coordinators.values()))
+    coordinator = coordinators.get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(
+            "Specify the config_entry_id of a loaded Resolume Arena entry"
+            if entry_id is None
+            else f"No loaded Resolume Arena entry {entry_id}"
+        )
+    return coordinator
+
+def async_setup_services(hass):
+    """Register the integration's services."""
+
+    async def trigger_column(call):
+        coordinator = _get_coordinator(hass, call)
+        return {"results": await coordinator.async_trigger_column(call.data[ATTR_COLUMN])}
+
+    async def trigger_clips(call):
+        coordinator = _get_coordinator(hass, call)
+        targets = [
+            (target[ATTR_LAYER_ID], target[ATTR_COLUMN]) if isinstance(target, dict) else target
+            for target in call.data[ATTR_CLIPS]
+        ]
+        return {"results": await coordinator.async_trigger_clips(targets)}
+
+    async def clear_layers(call):
+        coordinator = _get_coordinator(hass, call)
+        return {"results": await coordinator.async_clear_layers(call.data.get(ATTR_LAYERS))}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRIGGER_COLUMN, trigger_column, TRIGGER_COLUMN_SCHEMA, SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRIGGER_CLIPS, trigger_clips, TRIGGER_CLIPS_SCHEMA, SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CLEAR_LAYERS, clear_layers, CLEAR_LAYERS_SCHEMA, SupportsResponse.OPTIONAL
+    )
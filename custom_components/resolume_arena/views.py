@@ -0,0 +1,53 @@
+"""HTTP view proxying clip thumbnails through Home Assistant."""
+import hmac
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+from .helpers.api import clip_thumbnail_url
+
+class ResolumeThumbnailView(HomeAssistantView):
+    """Serves cached Arena thumbnails so dashboards never hit the show machine directly.
+
+    <img> tags can't send an auth header, so requests carry the coordinator's
+    random token instead, the same way camera snapshots do.
+    """
+
+    url = "/api/resolume_arena/thumbnail/{entry_id}/{clip_id}"
+    name = "api:resolume_arena:thumbnail"
+    requires_auth = False
+
+    def __init__(self, hass):
+        self.hass = hass
+
+    async def get(self, request, entry_id, clip_id):
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        token = request.query.get("token", "")
+        if coordinator is None or not hmac.compare_digest(token, coordinator.thumbnail_token):
+            raise web.HTTPNotFound()
+
+        try:
+            clip_id = int(clip_id)
+            size = int(request.query["size"]) if "size" in request.query else None
+        except ValueError:
+            raise web.HTTPBadRequest()
+
+        thumbnail = await coordinator.thumbnails.async_get(
+            clip_thumbnail_url(coordinator.host, coordinator.port, clip_id), clip_id, size
+        )
+        if thumbnail is None:
+            raise web.HTTPNotFound()
+
+        headers = {hdrs.CACHE_CONTROL: "private, max-age=60"}
+        if thumbnail.etag:
+            etag = thumbnail.etag
+            if size:
+                etag = '"{}-{}"'.format(etag.replace('"', ""), size)
+            headers[hdrs.ETAG] = etag
+            if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+                return web.Response(status=304, headers=headers)
+        if thumbnail.last_modified:
+            headers[hdrs.LAST_MODIFIED] = thumbnail.last_modified
+        return web.Response(body=thumbnail.body, content_type=thumbnail.content_type, headers=headers)
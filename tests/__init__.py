@@ -0,0 +1 @@
+"""Tests for the Resolume Arena integration."""
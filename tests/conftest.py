@@ -0,0 +1,11 @@
+"""Shared fixtures: custom integrations enabled, tools/ importable for the fake Arena server."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
@@ -0,0 +1,99 @@
+"""Request layer: coalescing, priorities and concurrency limits."""
+import asyncio
+
+from custom_components.resolume_arena.helpers.api import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_POLL,
+    PRIORITY_TRIGGER,
+    ArenaApi,
+    TokenBucket,
+)
+
+class FakeResponse:
+    def __init__(self, session, status):
+        self._session = session
+        self.status = status
+        self.headers = {}
+
+    async def __aenter__(self):
+        self._session.in_flight += 1
+        self._session.max_in_flight = max(self._session.max_in_flight, self._session.in_flight)
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.sleep(0.01)
+        self._session.in_flight -= 1
+        return False
+
+    async def read(self):
+        return b"{}"
+
+class FakeSession:
+    """Records what was sent and how many requests were in flight at once."""
+
+    def __init__(self):
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent.append(url)
+        return FakeResponse(self, 200)
+
+    def post(self, url, timeout=None):
+        self.sent.append(url)
+        return FakeResponse(self, 204)
+
+async def test_identical_gets_are_coalesced(hass):
+    session = FakeSession()
+    api = ArenaApi(hass, session, 0, 8)
+    responses = await asyncio.gather(*(api.get("/layer/1", 5) for _ in range(5)), api.get("/layer/2", 5))
+    assert session.sent == ["/layer/1", "/layer/2"]
+    assert [response.coalesced for response in responses] == [False, True, True, True, True, False]
+    assert api.coalesced == 4
+    assert all(response.body == b"{}" for response in responses)
+
+async def test_queued_callers_are_served_by_priority():
+    bucket = TokenBucket(rate=100, burst=1)
+    order = []
+
+    async def take(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    await bucket.acquire(PRIORITY_POLL)  # drain the burst so everyone queues
+    await asyncio.gather(
+        take("background", PRIORITY_BACKGROUND),
+        take("poll", PRIORITY_POLL),
+        take("trigger", PRIORITY_TRIGGER),
+    )
+    assert order == ["trigger", "poll", "background"]
+    assert bucket.throttled == {"trigger": 1, "poll": 1, "background": 1}
+
+async def test_cancelled_waiter_does_not_block_others():
+    bucket = TokenBucket(rate=50, burst=1)
+    await bucket.acquire(PRIORITY_POLL)
+    cancelled = asyncio.create_task(bucket.acquire(PRIORITY_TRIGGER))
+    waiting = asyncio.create_task(bucket.acquire(PRIORITY_POLL))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.wait_for(waiting, 1)
+
+async def test_limit_is_held_only_while_sending(hass):
+    session = FakeSession()
+    api = ArenaApi(hass, session, 0, 8)
+    limit = asyncio.Semaphore(2)
+    await asyncio.gather(*(api.get(f"/clip/{i}", 5, limit=limit) for i in range(6)))
+    assert len(session.sent) == 6
+    assert session.max_in_flight == 2
+    assert not limit.locked()
+
+async def test_requests_in_flight_are_capped_per_host(hass):
+    session = FakeSession()
+    api = ArenaApi(hass, session, 0, 3)
+    await asyncio.gather(
+        *(api.get(f"/layer/{i}", 5) for i in range(6)),
+        *(api.post(f"/clip/{i}/connect", 5) for i in range(4)),
+    )
+    assert len(session.sent) == 10
+    assert session.max_in_flight == 3
@@ -0,0 +1,34 @@
+"""ClipNameResolver cache."""
+from unittest.mock import patch
+
+from custom_components.resolume_arena.helpers import clip_names
+from custom_components.resolume_arena.helpers.clip_names import ClipNameResolver
+from custom_components.resolume_arena.helpers.metrics import CoordinatorMetrics
+
+async def test_expired_name_is_served_while_refreshed(hass):
+    lookups = []
+    resolved = []
+
+    async def fetch(clip_id):
+        lookups.append(clip_id)
+        return "Renamed"
+
+    resolver = ClipNameResolver(hass, fetch, resolved.append, CoordinatorMetrics())
+    resolver.preload({7: "Intro"})
+    with patch.object(clip_names, "monotonic", return_value=10**9):  # long after the TTL
+        assert resolver.get(7) == "Intro"
+        resolver.request([])
+        await resolver._task
+        assert resolver.get(7) == "Renamed"
+    assert lookups == [7]
+    assert resolved == [{7: "Renamed"}]
+
+async def test_retain_evicts(hass):
+    async def fetch(clip_id):
+        return None
+
+    resolver = ClipNameResolver(hass, fetch, lambda names: None, CoordinatorMetrics())
+    resolver.preload({1: "A", 2: "B"})
+    resolver.retain({2})
+    assert resolver.get(1) is None
+    assert resolver.names() == {2: "B"}
@@ -0,0 +1,29 @@
+"""Options flow."""
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.resolume_arena.const import (
+    CONF_MAX_CONCURRENCY,
+    CONF_UPDATE_MODE,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+    UPDATE_MODE_COMPOSITION,
+)
+
+async def test_options_flow(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: "192.168.1.50", CONF_PORT: 8080})
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+    defaults = {key.schema: key.default() for key in result["data_schema"].schema}
+    assert defaults[CONF_MAX_CONCURRENCY] == DEFAULT_MAX_CONCURRENCY
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**defaults, CONF_UPDATE_MODE: UPDATE_MODE_COMPOSITION, CONF_MAX_CONCURRENCY: 4}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_UPDATE_MODE] == UPDATE_MODE_COMPOSITION
+    assert entry.options[CONF_MAX_CONCURRENCY] == 4
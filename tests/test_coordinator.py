@@ -0,0 +1,135 @@
+"""Coordinator against tools/fake_arena.py, offline."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from custom_components.resolume_arena.const import (
+    CONF_REQUEST_RATE,
+    CONF_UPDATE_MODE,
+    UPDATE_MODE_COMPOSITION,
+    UPDATE_MODE_LAYERS,
+)
+from custom_components.resolume_arena.coordinator import ResolumeDataUpdateCoordinator
+from fake_arena import FakeArena, build_app
+
+@pytest.fixture
+async def arena(socket_enabled):
+    arena = FakeArena(layers=3, columns=4)
+    runner = web.AppRunner(build_app(arena))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    arena.port = site._server.sockets[0].getsockname()[1]
+    yield arena
+    await runner.cleanup()
+
+@pytest.fixture
+async def coordinator(hass, arena):
+    coordinator = ResolumeDataUpdateCoordinator(
+        hass, "127.0.0.1", arena.port, {CONF_UPDATE_MODE: UPDATE_MODE_LAYERS, CONF_REQUEST_RATE: 0}
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    yield coordinator
+    await coordinator.async_shutdown()
+
+async def wait_for(condition, timeout=5):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+def subscribed(arena, coordinator):
+    """Every parameter the coordinator indexed is subscribed on the fake's socket."""
+    wanted = set(coordinator._param_index)
+    return bool(wanted) and any(wanted <= subscriptions for subscriptions in arena.sockets.values())
+
+async def test_discovers_layers_and_slots(coordinator):
+    assert len(coordinator.get_layers()) == 3
+    assert len(coordinator.get_clip_slots()) == 12
+
+async def test_push_updates_state_and_resyncs_after_reconnect(hass, coordinator, arena):
+    layer_id = next(iter(coordinator.get_layers()))
+    writes = []
+    coordinator.async_add_listener(lambda: writes.append(layer_id), layer_id)
+    coordinator._debounced_refresh.cooldown = 0.05  # HA's 10 s default would outlast the test
+
+    with patch("custom_components.resolume_arena.helpers.websocket.WS_RECONNECT_MIN_SECONDS", 0.05):
+        await coordinator.async_start_push()
+        await wait_for(lambda: subscribed(arena, coordinator))
+        await hass.async_block_till_done()  # the resync refresh run on connect
+        resync_timer = coordinator._unsub_refresh
+
+        clip_id = coordinator.get_clip_slot(layer_id, 2).clip_id
+        await arena.connect_clip(clip_id)
+        await wait_for(lambda: coordinator.data[layer_id].active_clip_id == clip_id)
+        assert writes
+        # A push must not push back the slow resync poll.
+        assert coordinator._unsub_refresh is resync_timer
+
+        # Drop the socket, change the composition while it's down: the reconnect resyncs.
+        for ws in list(arena.sockets):
+            await ws.close()
+        await wait_for(lambda: not coordinator.push_connected)
+        missed = coordinator.get_clip_slot(layer_id, 3).clip_id
+        await arena.connect_clip(missed)
+        await wait_for(lambda: coordinator.push_connected)
+        await wait_for(lambda: coordinator.data[layer_id].active_clip_id == missed)
+
+async def test_all_layers_failing_fails_the_refresh(coordinator, arena):
+    layer_ids = list(coordinator.get_layers())
+    arena.error_rate = 1.0
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert all(coordinator.data[layer_id].stale for layer_id in layer_ids)
+
+async def test_failed_layer_read_keeps_its_slots(coordinator, arena):
+    layer_id = next(iter(coordinator.get_layers()))
+    slots = set(coordinator.get_clip_slots())
+    structure_version = coordinator._model.structure_version
+    layer = arena.layer
+    arena.layer = lambda requested: None if requested == layer_id else layer(requested)
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data[layer_id].stale
+    assert set(coordinator.get_clip_slots()) == slots
+    assert coordinator._model.structure_version == structure_version
+
+async def test_timeouts_back_off_in_composition_mode(hass, arena):
+    coordinator = ResolumeDataUpdateCoordinator(
+        hass, "127.0.0.1", arena.port, {CONF_UPDATE_MODE: UPDATE_MODE_COMPOSITION, CONF_REQUEST_RATE: 0}
+    )
+    await coordinator.async_refresh()
+    interval = coordinator.current_interval
+
+    async def timeout(*args, **kwargs):
+        raise asyncio.TimeoutError
+
+    with patch.object(coordinator.api, "get", timeout):
+        for _ in range(3):
+            await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.current_interval > interval
+    await coordinator.async_shutdown()
+
+async def test_trigger_is_shown_before_arena_confirms(coordinator):
+    layer_id = next(iter(coordinator.get_layers()))
+    slot = coordinator.get_clip_slot(layer_id, 2)
+    result = await coordinator.async_trigger_clip(layer_id, 2)
+    assert result["success"]
+    assert coordinator.data[layer_id].active_clip_id == slot.clip_id  # optimistic, no poll yet
+
+    coordinator._verify_debouncer.async_cancel()
+    await coordinator._async_verify_triggers()
+    assert coordinator.data[layer_id].active_clip_id == slot.clip_id
+    assert coordinator.metrics.rollbacks == 0
+
+async def test_osc_feedback_ignores_malformed_arguments(coordinator):
+    layer_id = next(iter(coordinator.get_layers()))
+    coordinator._osc_layer_ids = {1: layer_id}
+    coordinator._handle_osc_message("/composition/layers/1/clips/1/connected", ["3"])
+    coordinator._handle_osc_message("/composition/layers/1/solo", ["1"])
+    assert coordinator.data[layer_id].active_clip_id is None
+    assert not coordinator.data[layer_id].is_solo
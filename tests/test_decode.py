@@ -0,0 +1,44 @@
+"""Payload projection."""
+import json
+
+from custom_components.resolume_arena.helpers.decode import decode_composition, decode_layer, decode_push
+
+CLIP = {
+    "id": 11,
+    "name": {"id": 1, "value": "Intro", "valuetype": "ParamString"},
+    "connected": {"id": 2, "value": "Connected", "index": 3},
+    "transport": {"position": {"value": 0.25}},
+    "video": {"effects": [{"name": "Transform"}]},
+}
+LAYER = {
+    "id": 5,
+    "name": {"id": 3, "value": "Layer 1"},
+    "bypassed": {"id": 4, "value": False},
+    "solo": {"id": 6, "value": True},
+    "clips": [CLIP, None],
+    "video": {"opacity": {"value": 1}},
+}
+
+def test_layer_keeps_only_read_fields():
+    layer = decode_layer(json.dumps(LAYER).encode())
+    assert set(layer) == {"id", "name", "bypassed", "solo", "clips"}
+    assert layer["clips"][0] == {
+        "id": 11,
+        "name": {"id": 1, "value": "Intro"},
+        "connected": {"id": 2, "value": "Connected"},
+    }
+    assert layer["clips"][1] is None
+
+def test_composition_keeps_groups():
+    composition = decode_composition(json.dumps({
+        "name": {"value": "Show"},
+        "layers": [LAYER],
+        "layergroups": [{"id": 9, "name": {"value": "G"}, "layers": [LAYER]}],
+        "decks": [{"id": 1}],
+    }).encode())
+    assert "decks" not in composition
+    assert composition["layergroups"][0]["layers"][0]["id"] == 5
+
+def test_push_parameter_updates_pass_through():
+    message = {"type": "parameter_update", "id": 2, "value": "Connected"}
+    assert decode_push(json.dumps(message)) == message
@@ -0,0 +1,30 @@
+"""CompositionModel bookkeeping."""
+from custom_components.resolume_arena.helpers.model import CompositionModel
+
+def make_model():
+    model = CompositionModel()
+    for layer_id in (1, 2):
+        model.update_layer(layer_id, None, "Empty", False, False)
+        model.update_slots(layer_id, f"Layer {layer_id}", [(1, layer_id * 10, "A", False), (2, layer_id * 10 + 1, "B", False)])
+    return model
+
+def test_mark_stale_keeps_slots_and_structure():
+    model = make_model()
+    version = model.structure_version
+    assert model.mark_stale(1)
+    assert not model.mark_stale(1)
+    assert model.layers[1].stale
+    assert (1, 1) in model.slots
+    assert model.structure_version == version
+
+def test_update_clears_stale():
+    model = make_model()
+    model.mark_stale(1)
+    assert model.update_layer(1, None, "Empty", False, False)
+    assert not model.layers[1].stale
+
+def test_retain_layers_drops_only_missing_layers():
+    model = make_model()
+    assert model.retain_layers([1, 2]) == set()
+    assert model.retain_layers([2]) == {1}
+    assert set(model.slots) == {(2, 1), (2, 2)}
@@ -0,0 +1,28 @@
+"""OSC codec."""
+import struct
+
+from custom_components.resolume_arena.helpers.osc import _OscProtocol, decode_packet, encode_message
+
+def test_message_round_trip():
+    data = encode_message("/composition/layers/2/clips/3/connect", 1, 0.5, "name", True, False)
+    assert len(data) % 4 == 0
+    [(address, args)] = list(decode_packet(data))
+    assert address == "/composition/layers/2/clips/3/connect"
+    assert args == [1, 0.5, "name", True, False]
+
+def test_bundle():
+    messages = [encode_message("/a", 1), encode_message("/b", "x")]
+    bundle = b"#bundle\0" + b"\0" * 8 + b"".join(struct.pack(">i", len(m)) + m for m in messages)
+    assert list(decode_packet(bundle)) == [("/a", [1]), ("/b", ["x"])]
+
+def test_protocol_drops_malformed_and_survives_handler_errors():
+    received = []
+
+    def on_message(address, args):
+        received.append(address)
+        raise TypeError("bad argument")
+
+    protocol = _OscProtocol(on_message)
+    protocol.datagram_received(b"/a\0\0,i\0\0\0", ("127.0.0.1", 1))  # truncated int
+    protocol.datagram_received(encode_message("/b", "3"), ("127.0.0.1", 1))
+    assert received == ["/b"]
@@ -0,0 +1,32 @@
+"""AdaptiveScheduler interval choices."""
+from custom_components.resolume_arena.helpers.scheduler import AdaptiveScheduler
+
+def make_scheduler():
+    return AdaptiveScheduler(base=2, fast=1, idle_interval=30, backoff_max=120, boost_window=0)
+
+def test_idle_interval_grows_to_ceiling():
+    scheduler = make_scheduler()
+    intervals = [scheduler.record_success(False) for _ in range(20)]
+    assert intervals[0] > 2
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 30
+
+def test_long_idle_does_not_overflow():
+    scheduler = make_scheduler()
+    for _ in range(10_000):  # more than a day of idle polls at the ceiling
+        interval = scheduler.record_success(False)
+    assert interval == 30
+
+def test_change_resets_idle_growth():
+    scheduler = make_scheduler()
+    for _ in range(20):
+        scheduler.record_success(False)
+    assert scheduler.record_success(True) == 2
+
+def test_backoff_is_capped_and_does_not_overflow():
+    scheduler = make_scheduler()
+    for _ in range(5_000):
+        interval = scheduler.record_failure()
+        assert interval <= 120 * 1.2
+    assert interval >= 120 * 0.8
+    assert scheduler.record_success(False) < 30
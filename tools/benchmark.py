@@ -0,0 +1,346 @@
+"""Offline benchmarks of the coordinator against tools/fake_arena.py.
+
+Needs Home Assistant installed (the coordinator is a DataUpdateCoordinator); runs headless:
+
+    python tools/benchmark.py --layers 40 --columns 20 --groups 4 --unnamed 0.3 --output bench.json
+    python tools/benchmark.py ... --baseline bench.json --max-regression 0.25
+
+Scenarios, for each update mode (each mode against a fresh fake Arena, so both see the same show):
+
+* ``discovery``: first refresh of a fresh coordinator (composition + full sweep);
+* ``steady``: refreshes with nothing changing in Arena;
+* ``press``: trigger a clip over HTTP, then the optimistic update and its single-layer check.
+
+``decode`` times, outside Home Assistant, what parsing one cycle's payloads costs the event
+loop: the stdlib ``json.loads`` the coordinator used to run versus the projecting decoder.
+
+With ``--osc``, ``trigger_latency`` also compares how long Arena takes to report a triggered
+clip as connected when the trigger went over HTTP (reported on the websocket) or over OSC
+(reported on the OSC output).
+
+``flood`` runs with a request rate limit of ``FLOOD_REQUEST_RATE`` per second and overlaps a poll with clip presses and their verification reads: it reports
+what reached Arena, how many GETs were coalesced and throttled, and how long triggers took
+to be sent.
+
+Per scenario it reports cycle latency, HTTP requests and bytes parsed per cycle, event-loop
+time spent decoding, Python allocations per cycle (tracemalloc) and entity state writes per cycle. Entities are stood in
+for by coordinator listeners registered with the same layer contexts the real ones use.
+With ``--baseline`` it compares against a previous ``--output`` and exits 1 when a metric
+regressed by more than ``--max-regression``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+from custom_components.resolume_arena.const import (  # noqa: E402
+    CONF_OSC_ENABLED,
+    CONF_OSC_PORT,
+    CONF_OSC_FEEDBACK_PORT,
+    CONF_REQUEST_RATE,
+    CONF_UPDATE_MODE,
+    UPDATE_MODE_LAYERS,
+    UPDATE_MODE_COMPOSITION,
+)
+from custom_components.resolume_arena.helpers.api import clip_connect_url  # noqa: E402
+from custom_components.resolume_arena.helpers.decode import decode_composition, decode_layer  # noqa: E402
+from custom_components.resolume_arena.coordinator import ResolumeDataUpdateCoordinator  # noqa: E402
+from fake_arena import FakeArena, build_app, start_osc  # noqa: E402
+
+OSC_PORT = 17000
+OSC_FEEDBACK_PORT = 17001
+# flood exercises the request limiter, which is off by default.
+FLOOD_REQUEST_RATE = 20
+
+# Lower is better for every metric we compare.
+COMPARED_METRICS = (
+    "cycle_ms_mean",
+    "requests_per_cycle",
+    "bytes_per_cycle",
+    "decode_ms_per_cycle",
+    "alloc_kib_per_cycle",
+    "writes_per_cycle",
+)
+
+class Probe:
+    """Counts what one measured block costs."""
+
+    def __init__(self, arena, writes):
+        self._arena = arena
+        self._writes = writes
+        self.durations = []
+
+    async def measure(self, cycles, run_cycle, metrics):
+        self._arena.reset_stats()
+        self._writes[0] = 0
+        self.durations = []
+        decode_before = _decode_ms(metrics)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for _ in range(cycles):
+            started = time.perf_counter()
+            await run_cycle()
+            self.durations.append((time.perf_counter() - started) * 1000)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename") if stat.size_diff > 0)
+
+        durations = sorted(self.durations)
+        return {
+            "cycles": cycles,
+            "cycle_ms_mean": round(statistics.fmean(durations), 3),
+            "cycle_ms_p95": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+            "requests_per_cycle": round(self._arena.requests / cycles, 2),
+            "bytes_per_cycle": round(self._arena.bytes_sent / cycles),
+            "decode_ms_per_cycle": round((_decode_ms(metrics) - decode_before) / cycles, 3),
+            "alloc_kib_per_cycle": round(allocated / 1024 / cycles, 2),
+            "writes_per_cycle": round(self._writes[0] / cycles, 2),
+            "server_errors": self._arena.errors,
+        }
+
+def _decode_ms(metrics):
+    """Event-loop time the coordinator has spent decoding so far."""
+    phase = metrics.phases.get("decode")
+    return phase.total if phase else 0.0
+
+def attach_fake_entities(coordinator, writes):
+    """One listener per button and three per layer, keyed like the real entities."""
+    def on_update():
+        writes[0] += 1
+
+    for (layer_id, _col) in coordinator.get_clip_slots():
+        coordinator.async_add_listener(on_update, layer_id)
+    for layer_id in coordinator.get_layers():
+        for _ in range(3):  # active clip sensor, bypass, solo
+            coordinator.async_add_listener(on_update, layer_id)
+    coordinator.async_add_listener(on_update, None)  # poll interval sensor
+
+async def bench_mode(hass, arena, port, mode, cycles):
+    writes = [0]
+    probe = Probe(arena, writes)
+    results = {}
+    coordinator = ResolumeDataUpdateCoordinator(hass, "127.0.0.1", port, {CONF_UPDATE_MODE: mode})
+
+    results["discovery"] = await probe.measure(1, coordinator.async_refresh, coordinator.metrics)
+    attach_fake_entities(coordinator, writes)
+    await coordinator.async_refresh()  # settle background clip-name lookups
+    await asyncio.sleep(0.5)
+    await coordinator.async_refresh()
+
+    results["steady"] = await probe.measure(cycles, coordinator.async_refresh, coordinator.metrics)
+
+    clips = [(slot.layer_id, slot.clip_id) for slot in coordinator.get_clip_slots().values() if slot.clip_id]
+    presses = iter(clips[i * len(clips) // cycles] for i in range(cycles))
+
+    async def press():
+        layer_id, clip_id = next(presses)
+        status = await coordinator.api.post(clip_connect_url("127.0.0.1", port, clip_id), 5)
+        assert status in (200, 204), status
+        # What the button does, with the debounced verification run right away instead of after its delay.
+        coordinator.async_clip_triggered(layer_id, clip_id)
+        coordinator._verify_debouncer.async_cancel()
+        await coordinator._async_verify_triggers()
+
+    results["press"] = await probe.measure(cycles, press, coordinator.metrics)
+    await coordinator.async_shutdown()
+    return results
+
+def bench_decode(arena, repeat=20):
+    """Milliseconds of parsing per poll cycle, full stdlib decode vs projected decode."""
+    layer_bodies = [json_bytes(arena.layer_detail(layer)) for layer in arena.layers]
+    composition_body = json_bytes(arena.composition())
+
+    def per_cycle(decode, bodies):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for body in bodies:
+                decode(body)
+            timings.append((time.perf_counter() - started) * 1000)
+        return round(statistics.median(timings), 3)
+
+    results = {}
+    for mode, bodies, decode in (
+        (UPDATE_MODE_LAYERS, layer_bodies, decode_layer),
+        (UPDATE_MODE_COMPOSITION, [composition_body], decode_composition),
+    ):
+        full = per_cycle(json.loads, bodies)
+        projected = per_cycle(decode, bodies)
+        results[mode] = {
+            "bytes_per_cycle": sum(len(body) for body in bodies),
+            "stdlib_ms_per_cycle": full,
+            "projected_ms_per_cycle": projected,
+            "saved_ms_per_cycle": round(full - projected, 3),
+        }
+    return results
+
+async def bench_trigger_latency(hass, args):
+    """Command-to-report latency of HTTP and OSC triggers, from the coordinator's own metrics.
+
+    Each transport gets a fresh arena: Arena reports nothing for a clip that is already
+    connected, so re-pressing clips an earlier pass connected would measure nothing.
+    """
+    results = {}
+    for transport in ("http", "osc"):
+        async with fresh_arena(args) as (arena, port):
+            options = {CONF_UPDATE_MODE: UPDATE_MODE_LAYERS}
+            osc = None
+            if transport == "osc":
+                options.update({CONF_OSC_ENABLED: True, CONF_OSC_PORT: OSC_PORT, CONF_OSC_FEEDBACK_PORT: OSC_FEEDBACK_PORT})
+                osc = await start_osc(arena, "127.0.0.1", OSC_PORT, ("127.0.0.1", OSC_FEEDBACK_PORT))
+            coordinator = ResolumeDataUpdateCoordinator(hass, "127.0.0.1", port, options)
+            try:
+                await coordinator.async_refresh()
+                await coordinator.async_start_push()
+                await coordinator.async_start_osc()
+                await asyncio.sleep(0.5)  # websocket subscriptions
+
+                slots = list(coordinator.get_clip_slots())
+                for i in range(args.cycles):
+                    await coordinator.async_trigger_clip(*slots[i * len(slots) // args.cycles])
+                    await asyncio.sleep(0.05)
+                phase = coordinator.metrics.phases.get(f"trigger_{transport}_to_feedback")
+                results[transport] = phase.as_dict() if phase else None
+            finally:
+                await coordinator.async_shutdown()
+                if osc is not None:
+                    osc.close()
+    return results
+
+async def bench_flood(hass, arena, port, cycles):
+    """A poll overlapping button presses and their verification reads, through the request layer."""
+    coordinator = ResolumeDataUpdateCoordinator(
+        hass, "127.0.0.1", port, {CONF_UPDATE_MODE: UPDATE_MODE_LAYERS, CONF_REQUEST_RATE: FLOOD_REQUEST_RATE}
+    )
+    await coordinator.async_refresh()
+    api = coordinator.api
+    slots = list(coordinator.get_clip_slots())
+    coalesced = api.coalesced
+    throttled = sum(api.as_dict()["rate_limit"]["throttled"].values())
+    arena.reset_stats()
+
+    async def press(slot):
+        await coordinator.async_trigger_clip(*slot)
+        # The debounced verification, run right away so its layer read overlaps the poll's.
+        coordinator._verify_debouncer.async_cancel()
+        await coordinator._async_verify_triggers()
+
+    started = time.perf_counter()
+    for i in range(cycles):
+        await asyncio.gather(coordinator.async_refresh(), press(slots[i * len(slots) // cycles]))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    stats = api.as_dict()
+    trigger = coordinator.metrics.endpoints.get("clip_connect")
+    result = {
+        "cycles": cycles,
+        "cycle_ms_mean": round(elapsed / cycles, 3),
+        "requests_per_cycle": round(arena.requests / cycles, 2),
+        "coalesced_per_cycle": round((stats["coalesced"] - coalesced) / cycles, 2),
+        "throttled_per_cycle": round((sum(stats["rate_limit"]["throttled"].values()) - throttled) / cycles, 2),
+        "trigger_ms": trigger.latency.as_dict() if trigger else None,
+        "server_errors": arena.errors,
+    }
+    await coordinator.async_shutdown()
+    return {"layers": result}
+
+def compare(current, baseline, max_regression):
+    """Print metric deltas; returns the regressions beyond the threshold."""
+    regressions = []
+    for mode, scenarios in current["results"].items():
+        for scenario, metrics in scenarios.items():
+            old = baseline.get("results", {}).get(mode, {}).get(scenario)
+            if not old:
+                continue
+            for metric in COMPARED_METRICS:
+                before, after = old.get(metric), metrics.get(metric)
+                if not before or after is None:
+                    continue
+                delta = (after - before) / before
+                print(f"{mode:12} {scenario:10} {metric:22} {before:>12} -> {after:>12} ({delta:+.1%})")
+                if delta > max_regression:
+                    regressions.append((mode, scenario, metric, delta))
+    return regressions
+
+@asynccontextmanager
+async def fresh_arena(args):
+    """A new fake Arena and its server, so every scenario starts from the same untouched show."""
+    arena = FakeArena(
+        args.layers, args.columns, args.groups, args.group_depth, args.unnamed, args.latency_ms, args.error_rate
+    )
+    runner = web.AppRunner(build_app(arena))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield arena, site._server.sockets[0].getsockname()[1]
+    finally:
+        await runner.cleanup()
+
+async def run(args):
+    results = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            for mode in (UPDATE_MODE_LAYERS, UPDATE_MODE_COMPOSITION):
+                async with fresh_arena(args) as (arena, port):
+                    if "decode" not in results:
+                        results["decode"] = bench_decode(arena)
+                    results[mode] = await bench_mode(hass, arena, port, mode, args.cycles)
+            async with fresh_arena(args) as (arena, port):
+                results["flood"] = await bench_flood(hass, arena, port, args.cycles)
+            if args.osc:
+                results["trigger_latency"] = await bench_trigger_latency(hass, args)
+        finally:
+            await hass.async_stop(force=True)
+
+    config = {key: getattr(args, key) for key in (
+        "layers", "columns", "groups", "group_depth", "unnamed", "latency_ms", "error_rate", "cycles"
+    )}
+    return {"config": config, "results": results}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=int, default=40)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--groups", type=int, default=0)
+    parser.add_argument("--group-depth", type=int, default=1)
+    parser.add_argument("--unnamed", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--osc", action="store_true", help="also compare HTTP and OSC trigger latency")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON from a previous --output to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            regressions = compare(report, json.load(fh), args.max_regression)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {args.max_regression:.0%}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Local stand-in for the Resolume Arena webserver (REST + websocket).
+
+Lets the integration be exercised without a running Arena:
+
+    python tools/fake_arena.py --port 8080 --layers 4 --columns 8 --auto-trigger 2
+
+then add a Resolume Arena integration pointing at the machine running it. Compositions can
+be grown (--groups, --group-depth, --unnamed) and degraded (--latency-ms, --error-rate) to
+reproduce large or struggling shows; tools/benchmark.py drives it headlessly. With
+--osc-port it also takes OSC commands over UDP and reports changes as OSC to --osc-feedback.
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import random
+import re
+import struct
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger("fake_arena")
+API = "/api/v1"
+
+class FakeArena:
+    """In-memory composition with the subset of the Arena API the integration uses."""
+
+    def __init__(self, layers=4, columns=8, groups=0, group_depth=1, unnamed=0.0,
+                 latency_ms=0.0, error_rate=0.0, seed=0):
+        self._ids = itertools.count(1000)
+        self._random = random.Random(seed)
+        self.unnamed = unnamed
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.clip_names = {}  # {clip_id: name} also for clips served without an inline name
+        self.layers = [self._make_layer(idx, columns) for idx in range(1, layers + 1)]
+        self.layergroups = self._make_groups(groups, group_depth)
+        self.name = {"id": next(self._ids), "value": "Fake Composition"}
+        self.sockets = {}  # {websocket: subscribed param ids}
+        self.osc = None    # FakeOscServer, when OSC is enabled
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.requests = 0
+        self.bytes_sent = 0
+        self.errors = 0
+
+    def _param(self, value):
+        return {"id": next(self._ids), "value": value}
+
+    def _make_clip(self, layer_index, col):
+        clip_id = next(self._ids)
+        name = f"L{layer_index} Clip {col}"
+        self.clip_names[clip_id] = name
+        unnamed = self._random.random() < self.unnamed
+        return {
+            "id": clip_id,
+            "name": self._param(None if unnamed else name),
+            "connected": self._param("Disconnected"),
+            # Stand-in for the transport/effects/audio trees real clips carry.
+            "transport": {"position": self._param(0.0), "duration": self._param(10.0)},
+            "video": {"opacity": self._param(1.0), "effects": []},
+        }
+
+    def _make_layer(self, index, columns):
+        return {
+            "id": next(self._ids),
+            "name": self._param(f"Layer {index}"),
+            "bypassed": self._param(False),
+            "solo": self._param(False),
+            "clips": [self._make_clip(index, col) for col in range(1, columns + 1)],
+        }
+
+    def _make_groups(self, groups, depth):
+        """Spread layers over ``groups`` layergroups nested ``depth`` levels deep."""
+        if not groups:
+            return []
+        chunks = [self.layers[i::groups] for i in range(groups)]
+        result = []
+        for index, chunk in enumerate(chunks, start=1):
+            group = {"id": next(self._ids), "name": self._param(f"Group {index}"), "layers": chunk, "layergroups": []}
+            outer = group
+            for level in range(2, depth + 1):
+                outer = {
+                    "id": next(self._ids),
+                    "name": self._param(f"Group {index}.{level}"),
+                    "layers": [],
+                    "layergroups": [outer],
+                }
+            result.append(outer)
+        return result
+
+    def composition(self):
+        # Grouped layers are only listed inside their group, like Arena does.
+        grouped = {id(layer) for group in self.layergroups for layer in _group_layers(group)}
+        return {
+            "name": self.name,
+            "layers": [layer for layer in self.layers if id(layer) not in grouped],
+            "layergroups": self.layergroups,
+        }
+
+    def layer(self, layer_id):
+        return next((layer for layer in self.layers if layer["id"] == layer_id), None)
+
+    def clip(self, clip_id):
+        for layer in self.layers:
+            for clip in layer["clips"]:
+                if clip["id"] == clip_id:
+                    return layer, clip
+        return None, None
+
+    def layer_detail(self, layer):
+        active = next((c for c in layer["clips"] if c["connected"]["value"].startswith("Connected")), None)
+        return {**layer, "active_clip": active}
+
+    async def connect_clip(self, clip_id):
+        layer, clip = self.clip(clip_id)
+        if clip is None:
+            return False
+        for other in layer["clips"]:
+            value = "Connected" if other is clip else "Disconnected"
+            if other["connected"]["value"] != value:
+                other["connected"]["value"] = value
+                await self.push(other["connected"])
+        return True
+
+    async def connect_column(self, index):
+        """Connect the clip at a 1-based column on every layer that has one."""
+        if not self.layers or index > len(self.layers[0]["clips"]):
+            return False
+        for layer in self.layers:
+            await self.connect_clip(layer["clips"][index - 1]["id"])
+        return True
+
+    async def clear_layer(self, layer_id):
+        layer = self.layer(layer_id)
+        if layer is None:
+            return False
+        for clip in layer["clips"]:
+            if clip["connected"]["value"] != "Disconnected":
+                clip["connected"]["value"] = "Disconnected"
+                await self.push(clip["connected"])
+        return True
+
+    def osc_address(self, param_id):
+        """OSC output address and value of a layer/clip parameter, or None."""
+        for index, layer in enumerate(self.layers, start=1):
+            for field in ("bypassed", "solo"):
+                if layer[field]["id"] == param_id:
+                    return f"/composition/layers/{index}/{field}", int(layer[field]["value"])
+            for col, clip in enumerate(layer["clips"], start=1):
+                if clip["connected"]["id"] == param_id:
+                    return f"/composition/layers/{index}/clips/{col}/connected", 3 if clip["connected"]["value"] == "Connected" else 1
+        return None
+
+    async def push(self, param):
+        if self.osc is not None:
+            self.osc.feedback(param["id"])
+        message = {"type": "parameter_update", "id": param["id"], "value": param["value"]}
+        for ws, subscriptions in list(self.sockets.items()):
+            if param["id"] in subscriptions:
+                await ws.send_json(message)
+
+def _osc_string(data, offset):
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode(), (end // 4 + 1) * 4
+
+def _osc_pad(data):
+    return data + b"\0" * (4 - len(data) % 4)
+
+class FakeOscServer(asyncio.DatagramProtocol):
+    """Arena's OSC input (connect/clear commands) and output (parameter changes)."""
+
+    COMMAND = re.compile(r"^/composition/(?:layers/(\d+)/(?:clips/(\d+)/connect|(clear))|columns/(\d+)/connect)$")
+
+    def __init__(self, arena, feedback_addr):
+        self.arena = arena
+        self.feedback_addr = feedback_addr
+        self.transport = None
+        self.commands = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        address, _ = _osc_string(data, 0)
+        match = self.COMMAND.match(address)
+        if match is None:
+            return
+        self.commands += 1
+        layer, col, clear, column = match.groups()
+        if column:
+            asyncio.ensure_future(self.arena.connect_column(int(column)))
+        elif int(layer) <= len(self.arena.layers):
+            target = self.arena.layers[int(layer) - 1]
+            if clear:
+                asyncio.ensure_future(self.arena.clear_layer(target["id"]))
+            elif int(col) <= len(target["clips"]):
+                asyncio.ensure_future(self.arena.connect_clip(target["clips"][int(col) - 1]["id"]))
+
+    def feedback(self, param_id):
+        found = self.arena.osc_address(param_id)
+        if found is None or self.transport is None or self.feedback_addr is None:
+            return
+        address, value = found
+        self.transport.sendto(_osc_pad(address.encode()) + _osc_pad(b",i") + struct.pack(">i", value), self.feedback_addr)
+
+async def start_osc(arena, host, port, feedback_addr):
+    """Listen for OSC commands on host:port; changes are reported to feedback_addr."""
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: FakeOscServer(arena, feedback_addr), local_addr=(host, port)
+    )
+    arena.osc = protocol
+    return transport
+
+def _group_layers(group):
+    yield from group.get("layers", [])
+    for subgroup in group.get("layergroups", []):
+        yield from _group_layers(subgroup)
+
+def build_app(arena):
+    routes = web.RouteTableDef()
+
+    @routes.get(f"{API}/composition")
+    async def get_composition(request):
+        return web.json_response(arena.composition())
+
+    @routes.get(f"{API}/composition/layers/by-id/{{layer_id}}")
+    async def get_layer(request):
+        layer = arena.layer(int(request.match_info["layer_id"]))
+        if layer is None:
+            raise web.HTTPNotFound()
+        return web.json_response(arena.layer_detail(layer))
+
+    @routes.get(f"{API}/composition/clips/by-id/{{clip_id}}")
+    async def get_clip(request):
+        _, clip = arena.clip(int(request.match_info["clip_id"]))
+        if clip is None:
+            raise web.HTTPNotFound()
+        return web.json_response({**clip, "name": {**clip["name"], "value": arena.clip_names[clip["id"]]}})
+
+    @routes.post(f"{API}/composition/clips/by-id/{{clip_id}}/connect")
+    async def connect_clip(request):
+        if not await arena.connect_clip(int(request.match_info["clip_id"])):
+            raise web.HTTPNotFound()
+        return web.Response(status=204)
+
+    @routes.post(f"{API}/composition/columns/{{index}}/connect")
+    async def connect_column(request):
+        if not await arena.connect_column(int(request.match_info["index"])):
+            raise web.HTTPNotFound()
+        return web.Response(status=204)
+
+    @routes.post(f"{API}/composition/layers/by-id/{{layer_id}}/clear")
+    async def clear_layer(request):
+        if not await arena.clear_layer(int(request.match_info["layer_id"])):
+            raise web.HTTPNotFound()
+        return web.Response(status=204)
+
+    @routes.get(API)
+    async def websocket(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscriptions = arena.sockets[ws] = set()
+        try:
+            await ws.send_json(arena.composition())
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                action = msg.json()
+                parameter = str(action.get("parameter", ""))
+                if action.get("action") == "subscribe" and parameter.startswith("/parameter/by-id/"):
+                    subscriptions.add(int(parameter.rsplit("/", 1)[1]))
+        finally:
+            arena.sockets.pop(ws, None)
+        return ws
+
+    @web.middleware
+    async def instrument(request, handler):
+        arena.requests += 1
+        if request.path == API:  # websocket
+            return await handler(request)
+        if arena.latency_ms:
+            await asyncio.sleep(arena._random.uniform(0.5, 1.5) * arena.latency_ms / 1000)
+        if arena.error_rate and arena._random.random() < arena.error_rate:
+            arena.errors += 1
+            raise web.HTTPInternalServerError()
+        response = await handler(request)
+        if getattr(response, "body", None) is not None:
+            arena.bytes_sent += len(response.body)
+        return response
+
+    app = web.Application(middlewares=[instrument])
+    app.add_routes(routes)
+    app["arena"] = arena
+    return app
+
+async def auto_trigger(arena, period):
+    """Randomly connect clips so websocket pushes can be observed."""
+    while True:
+        await asyncio.sleep(period)
+        clip = random.choice(random.choice(arena.layers)["clips"])
+        await arena.connect_clip(clip["id"])
+
+async def main(args):
+    arena = FakeArena(
+        args.layers, args.columns, args.groups, args.group_depth, args.unnamed, args.latency_ms, args.error_rate
+    )
+    runner = web.AppRunner(build_app(arena))
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    _LOGGER.info("Fake Arena listening on http://%s:%s%s", args.host, args.port, API)
+    if args.osc_port:
+        feedback_host, _, feedback_port = args.osc_feedback.rpartition(":")
+        await start_osc(arena, args.host, args.osc_port, (feedback_host, int(feedback_port)))
+        _LOGGER.info("OSC on udp://%s:%s, feedback to %s", args.host, args.osc_port, args.osc_feedback)
+    try:
+        if args.auto_trigger:
+            await auto_trigger(arena, args.auto_trigger)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--groups", type=int, default=0, help="spread layers over this many layergroups")
+    parser.add_argument("--group-depth", type=int, default=1, help="nesting depth of each layergroup")
+    parser.add_argument("--unnamed", type=float, default=0.0, help="fraction of clips without an inline name")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="mean added latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--osc-port", type=int, default=0, help="UDP port taking OSC commands (0: no OSC)")
+    parser.add_argument("--osc-feedback", default="127.0.0.1:7001", help="host:port receiving OSC output")
+    parser.add_argument("--auto-trigger", type=float, default=0, help="seconds between random clip triggers")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,182 @@
+"""Estimate what a synthetic show costs Home Assistant's recorder, before and after trimming attributes.
+
+Standalone (no Home Assistant needed):
+
+    python tools/recorder_load.py --layers 20 --columns 20 --trigger-every 4
+
+Replays an hour of random clip triggers and models the recorder the way it stores states:
+every state_changed event is a ``states`` row, and attributes (minus the unrecorded ones) are
+serialized to JSON and stored once per distinct content in ``state_attributes``. Entities whose
+state and attributes didn't change write nothing, as Home Assistant drops those writes.
+
+"before" is the attribute layout the integration originally shipped: everything recorded,
+with host/layer_name/clip_name and a static Arena thumbnail URL. "after" is read from the
+button and sensor classes' source (``extra_state_attributes`` keys, icon/entity_picture and
+``_unrecorded_attributes``), so it follows the integration as it changes.
+"""
+import argparse
+import ast
+import json
+import os
+import random
+import secrets
+
+COMPONENT = os.path.join(os.path.dirname(__file__), "..", "custom_components", "resolume_arena")
+HOST = "192.168.1.50"
+PORT = 8080
+ENTRY = "01J0000000"
+
+# Home Assistant constants the entity classes may list in _unrecorded_attributes.
+HA_ATTRIBUTE_CONSTANTS = {"ATTR_ENTITY_PICTURE": "entity_picture", "ATTR_ICON": "icon"}
+
+def entity_attributes(module, class_name):
+    """(recorded attribute keys) of an entity class, read from the integration's source."""
+    with open(os.path.join(COMPONENT, module), encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+    cls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == class_name)
+    keys = {"friendly_name"}
+    unrecorded = set()
+    for node in cls.body:
+        if isinstance(node, ast.FunctionDef):
+            if node.name in ("icon", "entity_picture"):
+                keys.add(node.name)
+            elif node.name == "extra_state_attributes":
+                for ret in ast.walk(node):
+                    if isinstance(ret, ast.Return) and isinstance(ret.value, ast.Dict):
+                        keys.update(key.value for key in ret.value.keys)
+        elif isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            target = node.targets[0].id
+            if target == "_attr_icon":
+                keys.add("icon")
+            elif target == "_unrecorded_attributes":
+                for item in ast.walk(node.value):
+                    if isinstance(item, ast.Constant) and isinstance(item.value, str):
+                        unrecorded.add(item.value)
+                    elif isinstance(item, ast.Name) and item.id in HA_ATTRIBUTE_CONSTANTS:
+                        unrecorded.add(HA_ATTRIBUTE_CONSTANTS[item.id])
+    return keys - unrecorded
+
+BEFORE = {
+    "button": {"friendly_name", "icon", "entity_picture", "is_active", "layer_name", "layer_id",
+               "column_index", "clip_id", "clip_name", "host"},
+    "sensor": {"friendly_name", "icon", "layer_name", "layer_id", "active_clip_id"},
+}
+
+def after_layout():
+    return {
+        "button": entity_attributes("button.py", "ResolumeClipButton"),
+        "sensor": entity_attributes("sensor.py", "ResolumeActiveClipSensor"),
+    }
+
+def _pick(values, keys, kind):
+    unknown = keys - values.keys()
+    if unknown:
+        raise SystemExit(f"{kind} records {sorted(unknown)}: teach recorder_load.py what they hold")
+    return {key: values[key] for key in keys}
+
+def button_attributes(layout, layer, col, clip_id, active, token):
+    before = layout is BEFORE
+    values = {
+        "friendly_name": f"Resolume Composition Clip Layer {layer} C{col} (Layer {layer} Clip {col})",
+        "icon": "mdi:play-box" if active else "mdi:play-box-outline",
+        # Originally Arena's own URL; now proxied through Home Assistant with a per-restart token.
+        "entity_picture": (
+            f"http://{HOST}:{PORT}/api/v1/composition/clips/by-id/{clip_id}/thumbnail" if before
+            else f"/api/resolume_arena/thumbnail/{ENTRY}/{clip_id}?token={token}"
+        ),
+        "is_active": active,
+        "layer_name": f"Layer {layer}",
+        "layer_id": 1000 + layer,
+        "column_index": col,
+        "clip_id": clip_id,
+        "clip_name": f"Layer {layer} Clip {col}",
+        "host": HOST,
+    }
+    return _pick(values, layout["button"], "button")
+
+def sensor_attributes(layout, layer, active_clip_id):
+    values = {
+        "friendly_name": f"Resolume Composition Layer {layer} Active Clip",
+        "icon": "mdi:play-box",
+        "layer_name": f"Layer {layer}",
+        "layer_id": 1000 + layer,
+        "active_clip_id": active_clip_id,
+    }
+    return _pick(values, layout["sensor"], "sensor")
+
+class RecorderModel:
+    """Counts states rows and deduplicated state_attributes rows/bytes."""
+
+    def __init__(self):
+        self.current = {}        # {entity_id: (state, attributes_json)}
+        self.shared_attrs = set()
+        self.states_rows = 0
+        self.attributes_rows = 0
+        self.attributes_bytes = 0
+
+    def write(self, entity_id, state, attributes):
+        shared = json.dumps(attributes, separators=(",", ":"), sort_keys=True)
+        if self.current.get(entity_id) == (state, shared):
+            return
+        self.current[entity_id] = (state, shared)
+        self.states_rows += 1
+        if shared not in self.shared_attrs:
+            self.shared_attrs.add(shared)
+            self.attributes_rows += 1
+            self.attributes_bytes += len(shared.encode())
+
+def simulate(layout, args):
+    rng = random.Random(args.seed)
+    recorder = RecorderModel()
+    clip_ids = {(layer, col): 5000 + layer * 1000 + col for layer in range(1, args.layers + 1)
+                for col in range(1, args.columns + 1)}
+    active = {layer: None for layer in range(1, args.layers + 1)}
+
+    def write_layer(layer, token, only_cols=None):
+        for col in only_cols or range(1, args.columns + 1):
+            clip_id = clip_ids[(layer, col)]
+            recorder.write(
+                f"button.l{layer}_c{col}",
+                "unknown",
+                button_attributes(layout, layer, col, clip_id, active[layer] == clip_id, token),
+            )
+        recorder.write(f"sensor.l{layer}_active_clip", str(active[layer]), sensor_attributes(layout, layer, active[layer]))
+
+    seconds = 0
+    next_restart = 0
+    while seconds < 3600:
+        if seconds >= next_restart:
+            token = secrets.token_urlsafe(16)  # (re)start: new thumbnail token, every entity written
+            for layer in active:
+                write_layer(layer, token)
+            next_restart = seconds + args.restart_every if args.restart_every else float("inf")
+        layer = rng.randint(1, args.layers)
+        col = rng.randint(1, args.columns)
+        previous = active[layer]
+        active[layer] = clip_ids[(layer, col)]
+        changed_cols = [col] + [c for c in range(1, args.columns + 1) if clip_ids[(layer, c)] == previous]
+        write_layer(layer, token, changed_cols)
+        seconds += args.trigger_every
+    return recorder
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=int, default=20)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--trigger-every", type=int, default=4, help="seconds between clip triggers")
+    parser.add_argument("--restart-every", type=int, default=0, help="simulate an HA restart every N seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = {}
+    for name, layout in (("before", BEFORE), ("after", after_layout())):
+        recorder = simulate(layout, args)
+        results[name] = {
+            "states_rows_per_hour": recorder.states_rows,
+            "attribute_rows_per_hour": recorder.attributes_rows,
+            "attribute_bytes_per_hour": recorder.attributes_bytes,
+        }
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()